@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from paracore import map_cmds
+from example_utils import CONFIG_ROOT, first_configs
+
+from paracore import as_completed, map_cmds
 
 EXAMPLES_ROOT = Path(__file__).resolve().parent
-CONFIG_ROOT = EXAMPLES_ROOT / "inputs"
 RESULT_ROOT = EXAMPLES_ROOT / "results" / "batch"
 
 
+def _load_report(path: Path) -> dict:
+    """Read one worker's JSON report."""
+    return json.loads(path.read_bytes())
+
+
 def main() -> None:
     """Submit a throttled batch and collect summary statistics."""
 
@@ -20,7 +27,7 @@ def main() -> None:
             "Config directory missing. Run `python examples/generate_test_data.py` first."
         )
 
-    config_paths = sorted(CONFIG_ROOT.glob("config_*.json"))[:40]
+    config_paths = first_configs(40)
     RESULT_ROOT.mkdir(parents=True, exist_ok=True)
 
     cmds = []
@@ -54,29 +61,32 @@ def main() -> None:
 
     successes = 0
     failures: list[tuple[int, str, str]] = []
+    # Failures are reported by 1-based submission position, as in submission order
+    positions = {job: idx for idx, job in enumerate(jobs, start=1)}
 
-    for idx, job in enumerate(jobs, start=1):
+    # Harvest in completion order so a slow head job does not stall the rest
+    for done, job in enumerate(as_completed(jobs, poll_frequency=15), start=1):
         try:
             job.result()
             successes += 1
-            if idx % 10 == 0:
-                print(f"Completed {idx}/{len(jobs)} jobs")
         except Exception as exc:  # noqa: BLE001 - collect for reporting
-            failures.append((idx, job.job_id, str(exc)))
-
-    print(f"Batch complete: {successes} succeeded, {len(failures)} failed")
-    if failures:
-        for idx, job_id, error in failures[:5]:
-            print(f"  Job {idx} ({job_id}) failed: {error}")
-
-    # Aggregate scaled metrics from the produced result files
-    scaled_metrics = []
-    for output_file in RESULT_ROOT.glob("*_metrics.json"):
-        with output_file.open() as f:
-            report = json.load(f)
-        metric = report.get("scaled_metric")
-        if metric is not None:
-            scaled_metrics.append(metric)
+            failures.append((positions[job], job.job_id, str(exc)))
+        if done % 10 == 0:
+            print(f"Completed {done}/{len(jobs)} jobs")
+    failures.sort()
+
+    # Emit the summary as one write rather than a print per failure line
+    summary = [f"Batch complete: {successes} succeeded, {len(failures)} failed"]
+    summary.extend(f"  Job {idx} ({job_id}) failed: {error}" for idx, job_id, error in failures[:5])
+    print("\n".join(summary))
+
+    # Aggregate scaled metrics from the produced result files. Reads are latency-bound
+    # on shared filesystems (NFS/Lustre), so overlap them with a small thread pool.
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        reports = list(pool.map(_load_report, RESULT_ROOT.glob("*_metrics.json")))
+    scaled_metrics = [
+        report["scaled_metric"] for report in reports if report.get("scaled_metric") is not None
+    ]
 
     if scaled_metrics:
         average_metric = sum(scaled_metrics) / len(scaled_metrics)
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
 from pathlib import Path
 
-from paracore import map_func
+from paracore import SubmitHandle, map_func
 
 EXAMPLES_ROOT = Path(__file__).resolve().parent
 if str(EXAMPLES_ROOT) not in sys.path:
     sys.path.append(str(EXAMPLES_ROOT))
 
+from example_utils import CONFIG_ROOT, first_configs  # noqa: E402
 from process_data import process_config  # noqa: E402  (added after sys.path tweak)
 
 OUTPUT_ROOT = EXAMPLES_ROOT / "results" / "map_func"
@@ -24,14 +26,21 @@ def execute_config(cfg_path: str) -> dict:
     return process_config(cfg_path, output_file.as_posix(), mode="quick")
 
 
+async def _collect_reports(jobs: list[SubmitHandle]) -> list:
+    """Await every job concurrently; failures come back as exception objects."""
+    return await asyncio.gather(
+        *(job.result_async(poll_frequency=15) for job in jobs),
+        return_exceptions=True,
+    )
+
+
 def main() -> None:
-    input_dir = EXAMPLES_ROOT / "inputs"
-    if not input_dir.exists():
+    if not CONFIG_ROOT.exists():
         raise SystemExit(
             "Config directory missing. Run `python examples/generate_test_data.py` first."
         )
 
-    configs = [str(path) for path in sorted(input_dir.glob("config_*.json"))[:20]]
+    configs = [str(path) for path in first_configs(20)]
 
     jobs = map_func(
         fn=execute_config,
@@ -48,11 +57,10 @@ def main() -> None:
 
     total_scaled = 0.0
     completed = 0
-    for job in jobs:
-        try:
-            report = job.result()
-        except Exception as exc:  # noqa: BLE001 - surface worker failure
-            print(f"Job {job.job_id} failed: {exc}")
+    reports = asyncio.run(_collect_reports(jobs))
+    for job, report in zip(jobs, reports):
+        if isinstance(report, BaseException):
+            print(f"Job {job.job_id} failed: {report}")
             continue
 
         completed += 1
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from example_utils import CONFIG_ROOT, first_configs
+
 from paracore import autotune_from_pilot, map_cmds
 
 EXAMPLES_ROOT = Path(__file__).resolve().parent
-CONFIG_ROOT = EXAMPLES_ROOT / "inputs"
 RESULT_ROOT = EXAMPLES_ROOT / "results" / "autotune"
 
 
@@ -17,7 +18,7 @@ def main() -> None:
             "Config directory missing. Run `python examples/generate_test_data.py` first."
         )
 
-    configs = sorted(CONFIG_ROOT.glob("config_*.json"))
+    configs = first_configs(80)
     sample_configs = configs[:20]
 
     sample_cmds = [
@@ -46,6 +47,7 @@ def main() -> None:
         cpus_per_task_guess=2,
         mem_gb_guess=8,
         time_min_guess=20,
+        blocking_fraction=0.8,  # don't let one straggling pilot hold up the batch
     )
 
     print("Pilot recommendations:")
@@ -0,0 +1,25 @@
+"""Helpers shared by the example scripts."""
+
+from __future__ import annotations
+
+import heapq
+import os
+from pathlib import Path
+
+from paracore.jsonio import write_json
+
+__all__ = ["CONFIG_ROOT", "EXAMPLES_ROOT", "first_configs", "write_json"]
+
+EXAMPLES_ROOT = Path(__file__).resolve().parent
+CONFIG_ROOT = EXAMPLES_ROOT / "inputs"
+
+
+def first_configs(limit: int, config_root: Path = CONFIG_ROOT) -> list[Path]:
+    """Return the first ``limit`` configs in name order without sorting the whole directory."""
+    with os.scandir(config_root) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if entry.name.startswith("config_") and entry.name.endswith(".json")
+        ]
+    return [config_root / name for name in heapq.nsmallest(limit, names)]
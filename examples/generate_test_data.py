@@ -4,57 +4,54 @@
 from __future__ import annotations
 
 import csv
-import json
 import math
+import os
 import random
 from pathlib import Path
 
+from example_utils import write_json
 
 BASE_DIR = Path(__file__).resolve().parent
 DEFAULT_COUNT = 120
 ROWS_PER_DATASET = 240
 METRICS = ("mean", "max", "p95", "median")
+CATEGORIES = ("train", "validate", "test")
+
+_DATASET_RNG = random.Random()
 
 
 def _generate_dataset(path: Path, *, seed: int, rows: int = ROWS_PER_DATASET) -> dict[str, float]:
     """Write a CSV dataset with synthetic metrics and return quick stats."""
-    rng = random.Random(seed)
+    # Reseeding the shared generator gives the same stream as a fresh Random(seed)
+    rng = _DATASET_RNG
+    rng.seed(seed)
     base_value = rng.uniform(80, 160)
     jitter = rng.uniform(0.2, 0.6)
 
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    total = 0.0
-    total_sq = 0.0
-    min_value = math.inf
-    max_value = -math.inf
+    # Draw in the same per-row order as before so seeded datasets stay identical
+    choice, gauss, uniform = rng.choice, rng.gauss, rng.uniform
+    draws = [(choice(CATEGORIES), gauss(0, jitter), uniform(0.85, 1.15)) for _ in range(rows)]
+    values = [base_value * (1 + noise) for _, noise, _ in draws]
 
     with path.open("w", newline="") as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(["timestamp", "value", "baseline", "category"])
-        for idx in range(rows):
-            timestamp = idx
-            category = rng.choice(["train", "validate", "test"])
-            noise = rng.gauss(0, jitter)
-            value = base_value * (1 + noise)
-            baseline = base_value * rng.uniform(0.85, 1.15)
-
-            writer.writerow([timestamp, f"{value:.4f}", f"{baseline:.4f}", category])
-
-            total += value
-            total_sq += value * value
-            min_value = min(min_value, value)
-            max_value = max(max_value, value)
-
-    mean = total / rows
-    variance = max(total_sq / rows - mean**2, 0.0)
+        writer.writerows(
+            (idx, f"{value:.4f}", f"{base_value * scale:.4f}", category)
+            for idx, (value, (category, _, scale)) in enumerate(zip(values, draws))
+        )
+
+    mean = sum(values) / rows
+    variance = max(sum(v * v for v in values) / rows - mean**2, 0.0)
     stddev = math.sqrt(variance)
 
     return {
         "mean": mean,
         "stddev": stddev,
-        "min": min_value,
-        "max": max_value,
+        "min": min(values),
+        "max": max(values),
         "rows": rows,
     }
 
@@ -84,15 +81,18 @@ def generate_test_configs(
 
     rng = random.Random(13)
 
+    # Resolve the directory prefixes once; each iteration only formats the file name
+    dataset_prefix = os.path.join(dataset_root, "dataset_")
+    dataset_relative_prefix = os.path.join("..", dataset_root.relative_to(BASE_DIR), "dataset_")
+    config_prefix = os.path.join(config_root, "config_")
+
     for i in range(count):
-        dataset_path = dataset_root / f"dataset_{i:04d}.csv"
+        dataset_path = Path(f"{dataset_prefix}{i:04d}.csv")
         stats = _generate_dataset(dataset_path, seed=1_000 + i, rows=rows_per_dataset + (i % 50))
 
-        dataset_relative = Path("..") / dataset_path.relative_to(BASE_DIR)
-
         config = {
             "id": f"job_{i:04d}",
-            "dataset": str(dataset_relative),
+            "dataset": f"{dataset_relative_prefix}{i:04d}.csv",
             "analysis": _analysis_plan(rng),
             "resources": {
                 "estimated_rows": stats["rows"],
@@ -105,9 +105,7 @@ def generate_test_configs(
             },
         }
 
-        config_path = config_root / f"config_{i:04d}.json"
-        with config_path.open("w") as f:
-            json.dump(config, f, indent=2)
+        write_json(Path(f"{config_prefix}{i:04d}.json"), config)
 
     print(
         f"Generated {count} configs in {config_root}/ and datasets in {dataset_root}/."
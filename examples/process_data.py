@@ -7,12 +7,15 @@ import argparse
 import csv
 import json
 import math
-import statistics
 import sys
 import time
 from collections import Counter
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterable
+
+from example_utils import write_json
+
+FLOAT_METRICS = ("mean", "median", "max", "min", "p95")
 
 
 def _resolve_dataset(config_path: Path, dataset_field: str) -> Path:
@@ -22,25 +25,60 @@ def _resolve_dataset(config_path: Path, dataset_field: str) -> Path:
     return dataset_path
 
 
-def _iter_values(dataset_path: Path, *, normalize: bool) -> Iterable[tuple[float, str]]:
-    with dataset_path.open() as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            value = float(row["value"])
-            if normalize:
-                baseline = float(row.get("baseline", 1.0)) or 1.0
-                value /= baseline
-            yield value, row.get("category", "unknown")
+def _load_values(dataset_path: Path, *, normalize: bool) -> tuple[list[float], dict[str, int]]:
+    """Read the value column (optionally normalized) and count rows per category."""
+    with dataset_path.open(newline="") as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        rows = list(reader)
+
+    # Parse and normalize in the same pass so no intermediate list is built
+    value_idx = header.index("value")
+    if normalize and "baseline" in header:
+        baseline_idx = header.index("baseline")
+        values = [float(row[value_idx]) / (float(row[baseline_idx]) or 1.0) for row in rows]
+    else:
+        values = [float(row[value_idx]) for row in rows]
+
+    if "category" in header:
+        category_idx = header.index("category")
+        # Counter's constructor counts in C; map/itemgetter avoids a generator frame per row
+        categories = dict(Counter(map(itemgetter(category_idx), rows)))
+    else:
+        categories = {"unknown": len(rows)}
+
+    return values, categories
 
 
-def _percentile(values: list[float], percentile: float) -> float:
-    if not values:
-        return float("nan")
-    sorted_vals = sorted(values)
+def _percentile(sorted_vals: list[float], percentile: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
     idx = min(int(math.ceil(percentile * len(sorted_vals))) - 1, len(sorted_vals) - 1)
     return sorted_vals[max(idx, 0)]
 
 
+def _summarize(values: list[float]) -> dict[str, float | int | None]:
+    """Compute every summary metric from a single sort of the values.
+
+    Float metrics are ``None`` when no values survived filtering, so they are written
+    as JSON ``null`` rather than the non-standard ``NaN``.
+    """
+    ordered = sorted(values)
+    count = len(ordered)
+    if not count:
+        return {**dict.fromkeys(FLOAT_METRICS), "count": 0}
+
+    mid = count // 2
+    median = ordered[mid] if count % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+    return {
+        "mean": math.fsum(ordered) / count,
+        "median": median,
+        "max": ordered[-1],
+        "min": ordered[0],
+        "p95": _percentile(ordered, 0.95),
+        "count": count,
+    }
+
+
 def process_config(
     config_path: str,
     output_path: str | None = None,
@@ -65,27 +103,21 @@ def process_config(
     target_metric = analysis.get("metric", "mean")
     scale_factor = float(analysis.get("scale_factor", 1.0))
 
-    raw_values: list[float] = []
-    categories = Counter()
-
-    for value, category in _iter_values(dataset_path, normalize=normalize):
-        categories[category] += 1
-        if value >= min_value:
-            raw_values.append(value)
+    values, categories = _load_values(dataset_path, normalize=normalize)
+    raw_values = [value for value in values if value >= min_value]
 
     filtered_rows = len(raw_values)
-    total_rows = sum(categories.values())
-
-    metrics = {
-        "mean": statistics.mean(raw_values) if raw_values else float("nan"),
-        "median": statistics.median(raw_values) if raw_values else float("nan"),
-        "max": max(raw_values) if raw_values else float("nan"),
-        "min": min(raw_values) if raw_values else float("nan"),
-        "p95": _percentile(raw_values, 0.95) if raw_values else float("nan"),
-        "count": filtered_rows,
-    }
-    metric_value = metrics.get(target_metric, float("nan"))
-    scaled_value = metric_value * scale_factor if not math.isnan(metric_value) else float("nan")
+    total_rows = len(values)
+
+    metrics = _summarize(raw_values)
+    metric_value = metrics.get(target_metric)
+    scaled_value = metric_value * scale_factor if metric_value is not None else None
+
+    # Only the float metrics need rounding; they are all None or all numbers together
+    reported_metrics = dict.fromkeys(FLOAT_METRICS)
+    if metrics["count"]:
+        reported_metrics = {key: round(metrics[key], 4) for key in FLOAT_METRICS}
+    reported_metrics["count"] = metrics["count"]
 
     mode_delay = {
         "simple": 0.25,
@@ -99,12 +131,10 @@ def process_config(
         "dataset": str(dataset_path),
         "rows_total": total_rows,
         "rows_retained": filtered_rows,
-        "category_breakdown": dict(categories),
-        "metrics": {
-            k: round(v, 4) if isinstance(v, float) and not math.isnan(v) else v for k, v in metrics.items()
-        },
+        "category_breakdown": categories,
+        "metrics": reported_metrics,
         "target_metric": target_metric,
-        "scaled_metric": round(scaled_value, 4) if not math.isnan(scaled_value) else None,
+        "scaled_metric": round(scaled_value, 4) if scaled_value is not None else None,
         "mode": mode,
         "analysis": analysis,
         "processing_seconds": round(time.time() - start_time, 3),
@@ -113,8 +143,7 @@ def process_config(
     if output_path:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with output_file.open("w") as f:
-            json.dump(result, f, indent=2)
+        write_json(output_file, result)
         print(f"Processed {config_path} -> {output_path}")
     else:
         print(json.dumps(result, indent=2))
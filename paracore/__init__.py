@@ -1,18 +1,55 @@
 """Paracore - A thin wrapper over Slurm via Submitit for compute workloads."""
 
-from paracore.api import (
-    autotune_from_pilot,
-    map_cmds,
-    map_func,
-    run_cmd,
-)
-from paracore.types import SubmitHandle
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from paracore.api import (
+        as_completed,
+        autotune_from_pilot,
+        bulk_submit,
+        map_cmds,
+        map_func,
+        run_cmd,
+    )
+    from paracore.types import BulkSubmitError, SubmitHandle
 
 __version__ = "1.0.0"
 __all__ = [
+    "BulkSubmitError",
     "SubmitHandle",
+    "as_completed",
     "autotune_from_pilot",
+    "bulk_submit",
     "map_cmds",
     "map_func",
     "run_cmd",
 ]
+
+# Public names are imported on first access, so `import paracore` (and with it the
+# CLI's --help and --version) does not pay for loading submitit and PyYAML
+_EXPORTS = {
+    "BulkSubmitError": "paracore.types",
+    "SubmitHandle": "paracore.types",
+    "as_completed": "paracore.api",
+    "autotune_from_pilot": "paracore.api",
+    "bulk_submit": "paracore.api",
+    "map_cmds": "paracore.api",
+    "map_func": "paracore.api",
+    "run_cmd": "paracore.api",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
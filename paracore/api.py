@@ -2,15 +2,101 @@
 
 from __future__ import annotations
 
+import functools
+import heapq
 import math
 import random
 import subprocess
+import threading
 import time
-from typing import Any, Callable, Iterable, Literal, Mapping, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 from paracore.config import get_config
 from paracore.submitit_backend import SubmititBackend
-from paracore.types import SubmitHandle
+from paracore.types import BulkSubmitError, PilotMetrics, SubmitHandle
+
+T = TypeVar("T")
+
+_backend_instance: Optional[SubmititBackend] = None
+_backend_lock = threading.Lock()
+_thread_state = threading.local()
+
+
+def _get_backend() -> SubmititBackend:
+    """Get the backend for the global config, building it on first use."""
+    global _backend_instance
+    config = get_config()
+    with _backend_lock:
+        if _backend_instance is None or _backend_instance.config is not config:
+            _backend_instance = SubmititBackend(config)
+        return _backend_instance
+
+
+def _invalidate_backend() -> None:
+    """Drop the cached backend so the next call builds a fresh one."""
+    global _backend_instance
+    with _backend_lock:
+        _backend_instance = None
+
+
+def _local_random() -> random.Random:
+    """Get this thread's generator for jitter and backoff delays.
+
+    Threads submitting concurrently (e.g. under ``bulk_submit``) draw from their own
+    generator instead of sharing the module-level one.
+    """
+    rng = getattr(_thread_state, "rng", None)
+    if rng is None:
+        rng = _thread_state.rng = random.Random()
+    return rng
+
+
+def _maybe_jitter(jitter_s: float) -> None:
+    """Sleep a random fraction of ``jitter_s`` to spread out concurrent submissions."""
+    if jitter_s > 0:
+        time.sleep(jitter_s * _local_random().random())
+
+
+def _sleep_backoff(
+    attempt: int,
+    base: float,
+    cap: float = 600.0,
+    rng: Optional[random.Random] = None,
+) -> None:
+    """Sleep before retry ``attempt`` (0-based) using full-jitter exponential backoff.
+
+    The delay is drawn uniformly from ``[0, min(cap, base * 2**attempt)]`` so clients
+    that failed together do not retry against the controller in lockstep.
+    """
+    rng = rng or _local_random()
+    time.sleep(rng.uniform(0, min(cap, base * (2**attempt))))
+
+
+def _submit_with_retries(submit: Callable[[], T], retries: int, base: float) -> T:
+    """Call ``submit``, retrying up to ``retries`` times with jittered backoff."""
+    attempt = 0
+    while True:
+        try:
+            return submit()
+        except Exception:
+            # KeyboardInterrupt is not an Exception, so Ctrl-C always propagates
+            if attempt >= retries:
+                raise
+            _sleep_backoff(attempt, base)
+            attempt += 1
 
 
 def run_cmd(
@@ -32,40 +118,27 @@ def run_cmd(
     retry_backoff_s: float = 30.0,
 ) -> SubmitHandle:
     """Submit a single command to the cluster."""
-    config = get_config()
-    backend = SubmititBackend(config)
+    backend = _get_backend()
 
-    # Apply jitter if requested
-    if jitter_s > 0:
-        time.sleep(random.uniform(0, jitter_s))
+    _maybe_jitter(jitter_s)
 
     # Submit with retries
-    attempt = 0
-    while True:
-        try:
-            return backend.submit_cmd(
-                cmd=cmd,
-                job_name=job_name,
-                partition=partition,
-                time_min=time_min,
-                cpus_per_task=cpus_per_task,
-                mem_gb=mem_gb,
-                env_setup=env_setup,
-                env=env,
-                env_merge=env_merge,
-                account=account,
-                qos=qos,
-                extra=extra,
-            )
-        except Exception as exc:
-            if isinstance(exc, KeyboardInterrupt):
-                raise
-            # Only retry on known transient errors
-            if attempt >= retries:
-                raise
-            attempt += 1
-            backoff = retry_backoff_s * (2 ** (attempt - 1))
-            time.sleep(backoff + random.uniform(0, backoff * 0.1))
+    submit = functools.partial(
+        backend.submit_cmd,
+        cmd=cmd,
+        job_name=job_name,
+        partition=partition,
+        time_min=time_min,
+        cpus_per_task=cpus_per_task,
+        mem_gb=mem_gb,
+        env_setup=env_setup,
+        env=env,
+        env_merge=env_merge,
+        account=account,
+        qos=qos,
+        extra=extra,
+    )
+    return _submit_with_retries(submit, retries, retry_backoff_s)
 
 
 def map_cmds(
@@ -88,41 +161,30 @@ def map_cmds(
     retry_backoff_s: float = 30.0,
 ) -> list[SubmitHandle]:
     """Submit an array of commands to the cluster."""
-    config = get_config()
-    backend = SubmititBackend(config)
+    backend = _get_backend()
+    # Materialize once so retries resubmit the same list instead of re-reading input
+    cmds_list = list(cmds)
 
-    # Apply jitter if requested
-    if jitter_s > 0:
-        time.sleep(random.uniform(0, jitter_s))
+    _maybe_jitter(jitter_s)
 
     # Submit with retries
-    attempt = 0
-    while True:
-        try:
-            return backend.submit_cmd_array(
-                cmds=list(cmds),
-                job_name=job_name,
-                partition=partition,
-                time_min=time_min,
-                cpus_per_task=cpus_per_task,
-                mem_gb=mem_gb,
-                env_setup=env_setup,
-                env=env,
-                env_merge=env_merge,
-                array_parallelism=array_parallelism,
-                account=account,
-                qos=qos,
-                extra=extra,
-            )
-        except Exception as exc:
-            if isinstance(exc, KeyboardInterrupt):
-                raise
-            # Only retry on known transient errors
-            if attempt >= retries:
-                raise
-            attempt += 1
-            backoff = retry_backoff_s * (2 ** (attempt - 1))
-            time.sleep(backoff + random.uniform(0, backoff * 0.1))
+    submit = functools.partial(
+        backend.submit_cmd_array,
+        cmds=cmds_list,
+        job_name=job_name,
+        partition=partition,
+        time_min=time_min,
+        cpus_per_task=cpus_per_task,
+        mem_gb=mem_gb,
+        env_setup=env_setup,
+        env=env,
+        env_merge=env_merge,
+        array_parallelism=array_parallelism,
+        account=account,
+        qos=qos,
+        extra=extra,
+    )
+    return _submit_with_retries(submit, retries, retry_backoff_s)
 
 
 def map_func(
@@ -146,42 +208,208 @@ def map_func(
     retry_backoff_s: float = 30.0,
 ) -> list[SubmitHandle]:
     """Submit a function mapped over items to the cluster."""
-    config = get_config()
-    backend = SubmititBackend(config)
+    backend = _get_backend()
+    # Materialize once so retries resubmit the same list instead of re-reading input
+    items_list = list(items)
 
-    # Apply jitter if requested
-    if jitter_s > 0:
-        time.sleep(random.uniform(0, jitter_s))
+    _maybe_jitter(jitter_s)
 
     # Submit with retries
-    attempt = 0
-    while True:
+    submit = functools.partial(
+        backend.submit_func_array,
+        fn=fn,
+        items=items_list,
+        job_name=job_name,
+        partition=partition,
+        time_min=time_min,
+        cpus_per_task=cpus_per_task,
+        mem_gb=mem_gb,
+        env_setup=env_setup,
+        env=env,
+        env_merge=env_merge,
+        array_parallelism=array_parallelism,
+        account=account,
+        qos=qos,
+        extra=extra,
+    )
+    return _submit_with_retries(submit, retries, retry_backoff_s)
+
+
+class BulkSubmission:
+    """Commands queued inside a ``bulk_submit`` block.
+
+    ``handles`` is filled in submission order once the block exits. If some
+    submissions fail, it still holds the handles of the ones that went through, with
+    ``None`` in place of each failed command.
+    """
+
+    def __init__(self) -> None:
+        self.handles: list[Optional[SubmitHandle]] = []
+        self._requests: list[dict[str, Any]] = []
+
+    def run_cmd(
+        self,
+        cmd: str,
+        *,
+        job_name: Optional[str] = None,
+        partition: Optional[str] = None,
+        time_min: Optional[int] = None,
+        cpus_per_task: Optional[int] = None,
+        mem_gb: Optional[int] = None,
+        env_setup: Optional[str] = None,
+        env: Optional[Mapping[str, str]] = None,
+        env_merge: Literal["inherit", "replace"] = "inherit",
+        jitter_s: float = 0.0,
+        account: Optional[str] = None,
+        qos: Optional[str] = None,
+        extra: Optional[Mapping[str, Any]] = None,
+        retries: int = 0,
+        retry_backoff_s: float = 30.0,
+    ) -> int:
+        """Queue a command with the options of ``run_cmd``, including retries and jitter.
+
+        Returns the position of the command's handle in ``handles``.
+        """
+        self._requests.append(
+            {
+                "cmd": cmd,
+                "job_name": job_name,
+                "partition": partition,
+                "time_min": time_min,
+                "cpus_per_task": cpus_per_task,
+                "mem_gb": mem_gb,
+                "env_setup": env_setup,
+                "env": env,
+                "env_merge": env_merge,
+                "jitter_s": jitter_s,
+                "account": account,
+                "qos": qos,
+                "extra": extra,
+                "retries": retries,
+                "retry_backoff_s": retry_backoff_s,
+            }
+        )
+        return len(self._requests) - 1
+
+
+def _submit_queued(backend: SubmititBackend, request: Mapping[str, Any]) -> SubmitHandle:
+    """Submit one queued ``BulkSubmission`` command the way ``run_cmd`` would."""
+    options = dict(request)
+    jitter_s = options.pop("jitter_s")
+    retries = options.pop("retries")
+    retry_backoff_s = options.pop("retry_backoff_s")
+
+    _maybe_jitter(jitter_s)
+    submit = functools.partial(backend.submit_cmd, **options)
+    return _submit_with_retries(submit, retries, retry_backoff_s)
+
+
+@contextmanager
+def bulk_submit(fanout: int = 64, max_rate: Optional[float] = None) -> Iterator[BulkSubmission]:
+    """Queue single-command submissions and submit them concurrently on exit.
+
+    Submitting many singletons with ``run_cmd`` in a loop pays one ``sbatch``
+    round-trip per command. Inside this block commands are only queued; on exit they
+    are submitted with up to ``fanout`` calls in flight, starting at most ``max_rate``
+    per second if given. Nothing is submitted if the block raises. If some submissions
+    fail, ``BulkSubmitError`` is raised after the rest were attempted.
+    """
+    if fanout < 1:
+        raise ValueError("fanout must be at least 1")
+    if max_rate is not None and max_rate <= 0:
+        raise ValueError("max_rate must be positive")
+
+    bulk = BulkSubmission()
+    yield bulk
+
+    if bulk._requests:
+        backend = _get_backend()
         try:
-            return backend.submit_func_array(
-                fn=fn,
-                items=list(items),
-                job_name=job_name,
-                partition=partition,
-                time_min=time_min,
-                cpus_per_task=cpus_per_task,
-                mem_gb=mem_gb,
-                env_setup=env_setup,
-                env=env,
-                env_merge=env_merge,
-                array_parallelism=array_parallelism,
-                account=account,
-                qos=qos,
-                extra=extra,
+            bulk.handles = list(
+                backend.submit_cmd_bulk(
+                    bulk._requests,
+                    fanout=fanout,
+                    max_rate=max_rate,
+                    submit=functools.partial(_submit_queued, backend),
+                )
             )
-        except Exception as exc:
-            if isinstance(exc, KeyboardInterrupt):
-                raise
-            # Only retry on known transient errors
-            if attempt >= retries:
-                raise
-            attempt += 1
-            backoff = retry_backoff_s * (2 ** (attempt - 1))
-            time.sleep(backoff + random.uniform(0, backoff * 0.1))
+        except BulkSubmitError as exc:
+            bulk.handles = exc.handles
+            raise
+
+
+def _refresh_job_states(jobs: Iterable[SubmitHandle]) -> None:
+    """Refresh scheduler state for all pending jobs with one query per watcher.
+
+    Submitit registers every Slurm job with a shared class-level watcher that issues a
+    single ``sacct -j id1 -j id2 ...`` call for all registered ids. Forcing that update
+    once per tick lets the following ``done()`` checks read from its cache instead of
+    each job deciding on its own whether to shell out again.
+    """
+    watchers = {}
+    for job in jobs:
+        watcher = getattr(job._backend_job, "watcher", None)
+        if watcher is not None:
+            watchers[id(watcher)] = watcher
+
+    for watcher in watchers.values():
+        watcher.update()
+
+
+def as_completed(
+    jobs: Iterable[SubmitHandle],
+    *,
+    timeout: Optional[float] = None,
+    poll_frequency: float = 10.0,
+    poll_window: Optional[int] = None,
+) -> Iterator[SubmitHandle]:
+    """Yield handles in completion order rather than submission order.
+
+    Pending handles are checked once per polling tick, after a single batched
+    ``sacct`` refresh that covers all of them (see ``_refresh_job_states``). With
+    ``poll_window`` set, at most that many handles are checked per tick and the
+    unchecked ones go first on the next tick, which bounds the per-handle Python work
+    of a tick for very large arrays. It does not shrink the ``sacct`` query itself:
+    Submitit's shared watcher always asks about every registered, unfinished job,
+    although it does so with one ``-j`` per array rather than per task.
+    """
+    if poll_window is not None and poll_window < 1:
+        raise ValueError("poll_window must be at least 1")
+
+    pending = list(jobs)
+    start = time.monotonic()
+
+    while pending:
+        window = pending if poll_window is None else pending[:poll_window]
+        _refresh_job_states(window)
+        still_pending = []
+        for job in window:
+            if job.done():
+                yield job
+            else:
+                still_pending.append(job)
+        # Rotate so handles outside this tick's window are checked next
+        pending = pending[len(window) :] + still_pending
+
+        if not pending:
+            break
+        if timeout is not None and time.monotonic() - start > timeout:
+            raise TimeoutError(f"{len(pending)} jobs still pending after {timeout}s")
+        time.sleep(poll_frequency)
+
+
+# Per-pilot peak RSS percentile used to size memory for each OOM tolerance
+_OOM_TOLERANCE_PERCENTILES = {"minimal": 1.0, "low": 0.98, "medium": 0.60}
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of a non-empty list, ``q`` in [0, 1].
+
+    The result is the k-th largest value, so only the top ``1 - q`` share of values
+    needs ordering.
+    """
+    index = min(int(len(values) * q), len(values) - 1)
+    return heapq.nlargest(len(values) - index, values)[-1]
 
 
 def autotune_from_pilot(
@@ -196,10 +424,31 @@ def autotune_from_pilot(
     mem_gb_guess: int = 8,
     time_min_guess: int = 30,
     env_setup: Optional[str] = None,
+    blocking_fraction: float = 1.0,
+    oom_tolerance: Literal["minimal", "low", "medium"] = "minimal",
 ) -> dict[str, Any]:
-    """Run a pilot sample and suggest resource parameters."""
-    config = get_config()
-    backend = SubmititBackend(config)
+    """Run a pilot sample and suggest resource parameters.
+
+    With ``blocking_fraction < 1`` the pilot returns as soon as that share of jobs has
+    finished; the remaining stragglers are cancelled and suggestions are computed from
+    the jobs that arrived.
+
+    ``oom_tolerance`` picks the per-pilot peak RSS statistic that sizes ``mem_gb``:
+    ``"minimal"`` uses the maximum, ``"low"`` the p98 and ``"medium"`` the p60. Higher
+    tolerance requests less memory at the cost of more out-of-memory retries.
+    """
+    if not 0 < blocking_fraction <= 1:
+        raise ValueError("blocking_fraction must be in (0, 1]")
+    if runner not in ("cmds", "func"):
+        raise ValueError(f"Unknown runner: {runner}")
+    if runner == "func" and fn is None:
+        raise ValueError("fn must be provided when runner='func'")
+    if measurement not in ("time_only", "time_and_rss"):
+        raise ValueError(f"Unknown measurement: {measurement}")
+    if oom_tolerance not in _OOM_TOLERANCE_PERCENTILES:
+        raise ValueError(f"oom_tolerance must be one of {', '.join(_OOM_TOLERANCE_PERCENTILES)}")
+
+    backend = _get_backend()
 
     # Sample items
     items_list = list(sample_cmds_or_items)
@@ -207,83 +456,95 @@ def autotune_from_pilot(
         items_list = random.sample(items_list, sample_size)
 
     # Run pilot
+    pilot_options: Dict[str, Any] = {
+        "job_name": "paracore-pilot",
+        "partition": partition,
+        "time_min": time_min_guess,
+        "cpus_per_task": cpus_per_task_guess,
+        "mem_gb": mem_gb_guess,
+        "env_setup": env_setup,
+        "array_parallelism": None,
+        "collect_metrics": True,
+        "measure_memory": measurement == "time_and_rss",
+    }
     if runner == "cmds":
-        pilot_jobs = backend.submit_cmd_array(
-            cmds=items_list,
-            job_name="paracore-pilot",
-            partition=partition,
-            time_min=time_min_guess,
-            cpus_per_task=cpus_per_task_guess,
-            mem_gb=mem_gb_guess,
-            env_setup=env_setup,
-            array_parallelism=None,
-            collect_metrics=True,
-            measure_memory=measurement == "time_and_rss",
-        )
+        pilot_jobs = backend.submit_cmd_array(cmds=items_list, **pilot_options)
     else:
-        if fn is None:
-            raise ValueError("fn must be provided when runner='func'")
-        pilot_jobs = backend.submit_func_array(
-            fn=fn,
-            items=items_list,
-            job_name="paracore-pilot",
-            partition=partition,
-            time_min=time_min_guess,
-            cpus_per_task=cpus_per_task_guess,
-            mem_gb=mem_gb_guess,
-            env_setup=env_setup,
-            array_parallelism=None,
-            collect_metrics=True,
-            measure_memory=measurement == "time_and_rss",
-        )
+        assert fn is not None  # checked above
+        pilot_jobs = backend.submit_func_array(fn=fn, items=items_list, **pilot_options)
 
-    # Collect results
-    durations = []
-    max_rss_mb = 0
+    # Collect results in completion order until the quorum has arrived
+    quorum = math.ceil(blocking_fraction * len(pilot_jobs))
+    pilot_metrics = []
     failed_jobs = 0
+    collected = set()
+
+    # Result pickles are read on a thread pool so slow shared-filesystem reads overlap
+    # with each other and with polling for the remaining pilots
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(pilot_jobs)))) as pool:
+        fetches = []
+        for job in as_completed(pilot_jobs):
+            collected.add(id(job))
+            fetches.append(pool.submit(job.result))
+            if len(collected) >= quorum:
+                break
+
+        for fetch in fetches:
+            try:
+                result = fetch.result()
+            except (subprocess.SubprocessError, RuntimeError, OSError):
+                # Track pilot job failure but continue with remaining results
+                failed_jobs += 1
+                continue
+            if isinstance(result, PilotMetrics):
+                pilot_metrics.append(result)
 
+    durations = [m.duration_s for m in pilot_metrics]
+    rss_samples_mb = [m.max_rss_mb for m in pilot_metrics if m.max_rss_mb is not None]
+
+    # Stragglers past the quorum would only delay the suggestions
+    cancelled_jobs = 0
     for job in pilot_jobs:
+        if id(job) in collected:
+            continue
         try:
-            result = job.result()
-            if isinstance(result, dict) and "_paracore_metrics" in result:
-                metrics = result["_paracore_metrics"]
-                durations.append(metrics.get("duration_s", 0))
-                max_rss_mb = max(max_rss_mb, metrics.get("max_rss_mb", 0))
+            job.cancel()
+            cancelled_jobs += 1
         except (subprocess.SubprocessError, RuntimeError, OSError):
-            # Track pilot job failure but continue with remaining results
-            failed_jobs += 1
-            # In production, consider logging: logger.warning(f"Pilot job {job.job_id} failed: {e}")
+            # The job may have finished between the last poll and the cancel
             continue
 
+    max_array_parallelism = (
+        backend.config.get_cluster_config().get("slurm", {}).get("max_array_parallelism", 100)
+    )
+
     if not durations:
         # All pilot jobs failed - return guesses with warning flag
         recommendations = {
             "time_min": time_min_guess,
             "mem_gb": mem_gb_guess,
             "cpus_per_task": cpus_per_task_guess,
-            "array_parallelism": config.get_cluster_config()
-            .get("slurm", {})
-            .get("max_array_parallelism", 100),
-            "_warning": f"All {len(pilot_jobs)} pilot jobs failed. Using default guesses.",
+            "array_parallelism": max_array_parallelism,
+            "_warning": f"All {len(collected)} pilot jobs failed. Using default guesses.",
         }
         return recommendations
 
     # Compute recommendations
-    # Calculate p95 with bounds checking
-    sorted_durations = sorted(durations)
-    p95_index = min(int(len(sorted_durations) * 0.95), len(sorted_durations) - 1)
-    p95_duration = sorted_durations[p95_index] if sorted_durations else time_min_guess * 60
+    p95_duration = _percentile(durations, 0.95)
+    rss_mb = (
+        _percentile(rss_samples_mb, _OOM_TOLERANCE_PERCENTILES[oom_tolerance])
+        if rss_samples_mb
+        else 0
+    )
 
     recommendations = {
         "time_min": math.ceil(p95_duration * 1.3 / 60),
-        "mem_gb": math.ceil(max_rss_mb * 1.3 / 1024) if max_rss_mb > 0 else mem_gb_guess,
+        "mem_gb": math.ceil(rss_mb * 1.3 / 1024) if rss_mb > 0 else mem_gb_guess,
         "cpus_per_task": cpus_per_task_guess,
-        "array_parallelism": config.get_cluster_config()
-        .get("slurm", {})
-        .get("max_array_parallelism", 100),
+        "array_parallelism": max_array_parallelism,
     }
 
-    if failed_jobs > 0:
+    if failed_jobs > 0 or cancelled_jobs > 0:
         recommendations["_info"] = (
             f"Based on {len(durations)}/{len(pilot_jobs)} successful pilot jobs."
         )
@@ -1,13 +1,13 @@
 """CLI entry point for paracore."""
 
 import argparse
-import json
+import functools
 import sys
 from pathlib import Path
 from typing import List, Optional
 
-from paracore import autotune_from_pilot, map_cmds, run_cmd
-from paracore.status import get_job_status
+# Submission and status helpers are imported inside each subcommand so that --help,
+# --version and argument errors do not pay for loading submitit and PyYAML
 
 
 def parse_env_vars(env_list: Optional[List[str]]) -> dict:
@@ -15,18 +15,28 @@ def parse_env_vars(env_list: Optional[List[str]]) -> dict:
     if not env_list:
         return {}
 
-    env_dict = {}
-    for item in env_list:
-        if "=" not in item:
-            print(f"Warning: Invalid env format '{item}', expected KEY=VALUE", file=sys.stderr)
-            continue
-        key, value = item.split("=", 1)
-        env_dict[key] = value
-    return env_dict
+    invalid = [item for item in env_list if "=" not in item]
+    if invalid:
+        items = ", ".join(f"'{item}'" for item in invalid)
+        print(f"Warning: Invalid env format {items}, expected KEY=VALUE", file=sys.stderr)
+    return dict(item.split("=", 1) for item in env_list if "=" in item)
+
+
+def read_commands(path: str) -> List[str]:
+    """Read non-blank, stripped commands from a file, or from stdin when path is '-'."""
+    # One buffered read and a C-level split instead of iterating line by line
+    if path == "-":
+        data = sys.stdin.buffer.read()
+    else:
+        with open(path, "rb") as f:
+            data = f.read()
+    return [cmd for cmd in map(str.strip, data.decode().split("\n")) if cmd]
 
 
 def cmd_run(args):
     """Execute the 'run' subcommand."""
+    from paracore.api import run_cmd
+
     job = run_cmd(
         cmd=args.command,
         job_name=args.name,
@@ -65,12 +75,11 @@ def cmd_run(args):
 
 def cmd_batch(args):
     """Execute the 'batch' subcommand."""
-    # Read commands from file or stdin
-    if args.file == "-":
-        cmds = [line.strip() for line in sys.stdin if line.strip()]
-    else:
-        with open(args.file) as f:
-            cmds = [line.strip() for line in f if line.strip()]
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from paracore.api import map_cmds
+
+    cmds = read_commands(args.file)
 
     if not cmds:
         print("No commands to run", file=sys.stderr)
@@ -100,33 +109,42 @@ def cmd_batch(args):
 
     if args.wait:
         print("Waiting for all jobs to complete...")
-        results = []
+        n_jobs = len(jobs)
         failed = []
-        for i, job in enumerate(jobs):
-            try:
-                result = job.result(timeout=args.wait_timeout)
-                results.append(result)
-                if (i + 1) % 10 == 0:
-                    print(f"Completed {i + 1}/{len(jobs)} jobs")
-            except Exception as e:
-                failed.append((i, job.job_id, str(e)))
-
-        print(f"Completed {len(results)} jobs successfully")
+        # Wait on jobs concurrently so completions are reported as they happen rather
+        # than behind the slowest job earlier in the array
+        with ThreadPoolExecutor(max_workers=min(32, n_jobs)) as pool:
+            futures = {
+                pool.submit(job.result, timeout=args.wait_timeout): i for i, job in enumerate(jobs)
+            }
+            for done_count, future in enumerate(as_completed(futures), start=1):
+                i = futures[future]
+                try:
+                    # Called only to surface the job's exception; results are not kept
+                    future.result()
+                except Exception as e:
+                    failed.append((i, jobs[i].job_id, str(e)))
+                if done_count % 10 == 0:
+                    sys.stdout.write(f"Completed {done_count}/{n_jobs} jobs\n")
+                    sys.stdout.flush()
+        failed.sort()
+
+        # Command jobs return None, so successes are counted from failures
+        print(f"Completed {n_jobs - len(failed)} jobs successfully")
         if failed:
-            print(f"Failed {len(failed)} jobs", file=sys.stderr)
-            for idx, job_id, error in failed[:5]:
-                print(f"  Job {idx} ({job_id}): {error}", file=sys.stderr)
+            # Emit the failure summary as a single write
+            lines = [f"Failed {len(failed)} jobs\n"]
+            lines.extend(f"  Job {idx} ({job_id}): {error}\n" for idx, job_id, error in failed[:5])
+            sys.stderr.write("".join(lines))
             sys.exit(1)
 
 
 def cmd_autotune(args):
     """Execute the 'autotune' subcommand."""
-    # Read commands from file
-    if args.file == "-":
-        cmds = [line.strip() for line in sys.stdin if line.strip()]
-    else:
-        with open(args.file) as f:
-            cmds = [line.strip() for line in f if line.strip()]
+    from paracore.api import autotune_from_pilot
+    from paracore.jsonio import write_json
+
+    cmds = read_commands(args.file)
 
     if not cmds:
         print("No commands for pilot", file=sys.stderr)
@@ -144,6 +162,8 @@ def cmd_autotune(args):
         mem_gb_guess=args.memory_guess,
         time_min_guess=args.time_guess,
         env_setup=args.env_setup,
+        blocking_fraction=args.blocking_fraction,
+        oom_tolerance=args.oom_tolerance,
     )
 
     print("\nResource recommendations:")
@@ -153,8 +173,7 @@ def cmd_autotune(args):
     print(f"  Parallelism: {suggestions['array_parallelism']}")
 
     if args.output:
-        with open(args.output, "w") as f:
-            json.dump(suggestions, f, indent=2)
+        write_json(args.output, suggestions)
         print(f"\nRecommendations saved to {args.output}")
 
     if args.export_shell:
@@ -189,21 +208,32 @@ def _format_sacct_info(info: dict[str, str]) -> str:
 
 def cmd_status(args):
     """Check the status of one or more submitted jobs."""
+    from paracore.status import get_job_status, get_job_statuses
+
     if not args.job_ids:
         print("Provide at least one job id (e.g., 'paracore status 12345_0')", file=sys.stderr)
         sys.exit(1)
 
     log_dir = Path(args.log_dir).expanduser()
-    refresh = bool(getattr(args, "refresh", False))
     exit_code = 0
 
+    # One sacct query covers every requested id, so it is always fresh. If the batch
+    # fails, look each id up on its own so one bad id does not hide the others.
+    try:
+        statuses = get_job_statuses(args.job_ids, log_dir=log_dir)
+    except Exception:
+        statuses = None
+
     for job_id in args.job_ids:
-        try:
-            status = get_job_status(job_id, log_dir=log_dir, refresh=refresh)
-        except Exception as exc:  # pragma: no cover - defensive guard
-            print(f"{job_id}: unable to load status ({exc})", file=sys.stderr)
-            exit_code = 1
-            continue
+        if statuses is not None:
+            status = statuses[job_id]
+        else:
+            try:
+                status = get_job_status(job_id, log_dir=log_dir, refresh=True)
+            except Exception as exc:
+                print(f"{job_id}: unable to load status ({exc})", file=sys.stderr)
+                exit_code = 1
+                continue
 
         print(f"{status.job_id}: {status.state}")
 
@@ -221,8 +251,9 @@ def cmd_status(args):
         sys.exit(exit_code)
 
 
-def main():
-    """Main CLI entry point."""
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once per process."""
     parser = argparse.ArgumentParser(
         description="Paracore - Slurm job submission made easy",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -322,6 +353,18 @@ Examples:
     )
     tune_parser.add_argument("--env-setup", help="Environment setup command")
     tune_parser.add_argument("--measure-memory", action="store_true", help="Measure memory usage")
+    tune_parser.add_argument(
+        "--blocking-fraction",
+        type=float,
+        default=1.0,
+        help="Return once this fraction of pilots finished and cancel the rest",
+    )
+    tune_parser.add_argument(
+        "--oom-tolerance",
+        choices=["minimal", "low", "medium"],
+        default="minimal",
+        help="Size memory from max (minimal), p98 (low) or p60 (medium) pilot peak RSS",
+    )
     tune_parser.add_argument("-o", "--output", help="Save recommendations to JSON file")
     tune_parser.add_argument(
         "--export-shell", action="store_true", help="Print shell export commands"
@@ -339,12 +382,17 @@ Examples:
     status_parser.add_argument(
         "--refresh",
         action="store_true",
-        help="Force sacct refresh instead of using cached info",
+        help="Accepted for compatibility; status always comes from a fresh sacct query",
     )
     status_parser.set_defaults(func=cmd_status)
 
-    # Parse arguments
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main CLI entry point."""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
@@ -2,19 +2,97 @@
 
 from __future__ import annotations
 
+import copy
 import hashlib
-import re
+import string
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional, Tuple
 
 import yaml
 
+try:
+    # libyaml C binding; safe_load otherwise uses the pure-Python loader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader
+
+_DASH = ord("-")
+
+
+class _SanitizeTable(Dict[int, int]):
+    """``str.translate`` table mapping every disallowed character to ``-``.
+
+    Only the allowed ASCII characters are stored; any other code point, including
+    non-ASCII ones, falls through to ``__missing__``.
+    """
+
+    def __missing__(self, codepoint: int) -> int:
+        return _DASH
+
+
+# Job name sanitization table, built once rather than per submitted job
+_SANITIZE_TABLE = _SanitizeTable(
+    (ord(c), ord(c)) for c in string.ascii_letters + string.digits + "-_"
+)
+
+# Slurm fields in Config.resolve() that a caller-supplied override replaces outright
+_OVERRIDABLE_KEYS = frozenset(
+    ("partition", "account", "qos", "cpus_per_task", "mem_gb", "time_min")
+)
+
+# Upper bound on cached formatted job names per Config
+_JOB_NAME_CACHE_SIZE = 256
+
+# Parsed YAML files keyed by (path, mtime_ns, size), so unchanged files are not reparsed
+_YAML_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+def _load_yaml_cached(path: Path) -> Optional[Dict[str, Any]]:
+    """Load a YAML mapping, reusing the parse of an unchanged file.
+
+    Returns ``None`` if the file does not exist. Callers get their own copy, so merging
+    or editing it never leaks into the cache.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(key)
+    if cached is None:
+        with open(path) as f:
+            cached = yaml.load(f, Loader=_YamlLoader) or {}
+        _YAML_CACHE[key] = cached
+    return copy.deepcopy(cached)
+
 
 class Config:
     """Layered configuration system."""
 
+    __slots__ = (
+        "_active_cluster",
+        "_cluster_configs",
+        "_config",
+        "_default_template",
+        "_job_names",
+        "_max_len",
+        "_resolve_baselines",
+    )
+
     def __init__(self):
         self._config = self._load_config()
+        # Values read on every submission, looked up once; the layered config is fixed
+        # after loading
+        naming = self._config.get("naming", {})
+        self._active_cluster: str = self._config.get("active_cluster", "default")
+        self._max_len: int = naming.get("max_len", 80)
+        self._default_template: str = naming.get("default_job_name", "paracore-job")
+        # Merged per-cluster configs
+        self._cluster_configs: Dict[str, Dict[str, Any]] = {}
+        self._resolve_baselines: Dict[Optional[str], Dict[str, Any]] = {}
+        # Formatted job names by (name, context)
+        self._job_names: Dict[Tuple[Optional[str], FrozenSet[Tuple[str, Any]]], str] = {}
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from multiple sources with proper layering."""
@@ -22,18 +100,14 @@ class Config:
         config = self._get_defaults()
 
         # Layer user config
-        user_config_path = Path.home() / ".paracore.yaml"
-        if user_config_path.exists():
-            with open(user_config_path) as f:
-                user_config = yaml.safe_load(f) or {}
-                config = self._merge_configs(config, user_config)
+        user_config = _load_yaml_cached(Path.home() / ".paracore.yaml")
+        if user_config is not None:
+            config = self._merge_configs(config, user_config)
 
         # Layer project config
-        project_config_path = Path("./paracore.yaml")
-        if project_config_path.exists():
-            with open(project_config_path) as f:
-                project_config = yaml.safe_load(f) or {}
-                config = self._merge_configs(config, project_config)
+        project_config = _load_yaml_cached(Path("./paracore.yaml"))
+        if project_config is not None:
+            config = self._merge_configs(config, project_config)
 
         return config
 
@@ -65,25 +139,38 @@ class Config:
         }
 
     def _merge_configs(self, base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
-        """Deep merge overlay config into base config."""
-        result = base.copy()
+        """Deep merge overlay config into base config.
 
-        for key, value in overlay.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
+        Only dicts on a merged path are copied; ``base`` and ``overlay`` are never
+        modified.
+        """
+        result = base.copy()
+        stack = [(result, overlay)]
+
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                current = dst.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    dst[key] = current = current.copy()
+                    stack.append((current, value))
+                else:
+                    dst[key] = value
 
         return result
 
     def get_active_cluster(self) -> str:
         """Get the currently active cluster name."""
-        return self._config.get("active_cluster", "default")
+        return self._active_cluster
 
     def get_cluster_config(self, cluster: Optional[str] = None) -> Dict[str, Any]:
         """Get configuration for a specific cluster."""
         if cluster is None:
-            cluster = self.get_active_cluster()
+            cluster = self._active_cluster
+
+        cached = self._cluster_configs.get(cluster)
+        if cached is not None:
+            return cached
 
         clusters = self._config.get("clusters", {})
         default_cluster = clusters.get("default")
@@ -91,82 +178,117 @@ class Config:
         if cluster in clusters:
             cluster_config = clusters[cluster]
             if cluster != "default" and default_cluster:
-                return self._merge_configs(default_cluster, cluster_config)
+                cluster_config = self._merge_configs(default_cluster, cluster_config)
+            self._cluster_configs[cluster] = cluster_config
             return cluster_config
 
         raise ValueError(f"Unknown cluster: {cluster}")
 
-    def resolve(self, cluster: Optional[str] = None, **overrides) -> Dict[str, Any]:
-        """Resolve final configuration with overrides."""
+    def _resolve_baseline(self, cluster: Optional[str]) -> Dict[str, Any]:
+        """Get the override-free resolved config for a cluster, cached per cluster."""
+        cached = self._resolve_baselines.get(cluster)
+        if cached is not None:
+            return cached
+
         cluster_config = self.get_cluster_config(cluster)
         slurm_config = cluster_config.get("slurm", {})
 
-        # Build resolved config
-        resolved = {
-            "cluster": cluster or self.get_active_cluster(),
+        baseline = {
+            "cluster": cluster or self._active_cluster,
             "default_env": cluster_config.get("default_env"),
             "io_scratch": cluster_config.get("io_scratch"),
-            "partition": overrides.get("partition", slurm_config.get("partition")),
-            "account": overrides.get("account", slurm_config.get("account")),
-            "qos": overrides.get("qos", slurm_config.get("qos")),
-            "cpus_per_task": overrides.get("cpus_per_task", slurm_config.get("cpus_per_task")),
-            "mem_gb": overrides.get("mem_gb", slurm_config.get("mem_gb")),
-            "time_min": overrides.get("time_min", slurm_config.get("time_min")),
+            "partition": slurm_config.get("partition"),
+            "account": slurm_config.get("account"),
+            "qos": slurm_config.get("qos"),
+            "cpus_per_task": slurm_config.get("cpus_per_task"),
+            "mem_gb": slurm_config.get("mem_gb"),
+            "time_min": slurm_config.get("time_min"),
             "max_array_parallelism": slurm_config.get("max_array_parallelism"),
-            "start_jitter_s": overrides.get("jitter_s", slurm_config.get("start_jitter_s", 0)),
-            "extra": {**slurm_config.get("extra", {}), **overrides.get("extra", {})},
+            "start_jitter_s": slurm_config.get("start_jitter_s", 0),
+            "extra": slurm_config.get("extra", {}),
         }
+        self._resolve_baselines[cluster] = baseline
+        return baseline
 
-        if "array_parallelism" in overrides and overrides["array_parallelism"] is not None:
-            resolved["array_parallelism"] = overrides["array_parallelism"]
+    def resolve(self, cluster: Optional[str] = None, **overrides) -> Dict[str, Any]:
+        """Resolve final configuration with overrides."""
+        baseline = self._resolve_baseline(cluster)
+
+        # Copy the cached baseline and overlay overrides in a single pass
+        resolved = baseline.copy()
+        resolved["extra"] = {**baseline["extra"], **(overrides.get("extra") or {})}
 
-        # Add any additional overrides not in standard fields
         for key, value in overrides.items():
-            if key not in resolved and value is not None:
+            if key in _OVERRIDABLE_KEYS:
+                resolved[key] = value
+            elif key == "jitter_s":
+                resolved["start_jitter_s"] = value
+            elif key not in resolved and value is not None:
+                # Additional overrides not in standard fields
                 resolved[key] = value
 
         return resolved
 
     def format_job_name(self, job_name: Optional[str], **context) -> str:
-        """Format and sanitize job name."""
+        """Format and sanitize job name.
+
+        Results are cached per name and context, since repeated submissions usually
+        format the same name.
+        """
+        try:
+            key = (job_name, frozenset(context.items()))
+            cached = self._job_names.get(key)
+        except TypeError:
+            # Unhashable context value
+            return self._format_job_name(job_name, context)
+
+        if cached is None:
+            if len(self._job_names) >= _JOB_NAME_CACHE_SIZE:
+                self._job_names.clear()
+            cached = self._job_names[key] = self._format_job_name(job_name, context)
+        return cached
+
+    def _format_job_name(self, job_name: Optional[str], context: Dict[str, Any]) -> str:
+        """Format and sanitize a job name without consulting the cache."""
         if job_name is None:
             # Use default template
-            naming = self._config.get("naming", {})
-            template = naming.get("default_job_name", "paracore-job")
-            job_name = template
+            job_name = self._default_template
 
-        # Format with available context
-        try:
-            cluster = context.get("cluster", self.get_active_cluster())
+        # Format with available context; names without placeholders need no context
+        if "{" in job_name:
             try:
-                cluster_config = self.get_cluster_config(cluster)
-            except ValueError:
-                cluster_config = self.get_cluster_config()
-
-            format_context = {
-                "project": context.get("project", "paracore"),
-                "cluster": cluster,
-                "partition": context.get(
-                    "partition", cluster_config.get("slurm", {}).get("partition", "unknown")
-                ),
-                "env": context.get("env", cluster_config.get("default_env", "default")),
-                **context,
-            }
-
-            job_name = job_name.format(**format_context)
-        except (KeyError, ValueError):
-            # If formatting fails, use as-is
-            pass
+                cluster = context.get("cluster", self._active_cluster)
+                try:
+                    cluster_config = self.get_cluster_config(cluster)
+                except ValueError:
+                    cluster_config = self.get_cluster_config()
+
+                format_context = {
+                    "project": context.get("project", "paracore"),
+                    "cluster": cluster,
+                    "partition": context.get(
+                        "partition", cluster_config.get("slurm", {}).get("partition", "unknown")
+                    ),
+                    "env": context.get("env", cluster_config.get("default_env", "default")),
+                    **context,
+                }
+
+                job_name = job_name.format(**format_context)
+            except (KeyError, ValueError):
+                # If formatting fails, use as-is
+                pass
 
         # Sanitize
-        job_name = re.sub(r"[^a-zA-Z0-9\-_]", "-", job_name)
-        job_name = re.sub(r"-+", "-", job_name).strip("-")
+        job_name = job_name.translate(_SANITIZE_TABLE)
+        while "--" in job_name:
+            job_name = job_name.replace("--", "-")
+        job_name = job_name.strip("-")
 
         # Truncate if needed
-        max_len = self._config.get("naming", {}).get("max_len", 80)
+        max_len = self._max_len
         if len(job_name) > max_len:
             # Add short hash of original name
-            hash_suffix = hashlib.md5(job_name.encode()).hexdigest()[:6]
+            hash_suffix = hashlib.blake2b(job_name.encode(), digest_size=3).hexdigest()
             job_name = f"{job_name[:max_len-7]}-{hash_suffix}"
 
         return job_name or "paracore-job"
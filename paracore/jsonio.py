@@ -0,0 +1,29 @@
+"""JSON output shared by the CLI and the example scripts."""
+
+import functools
+import os
+from typing import Any, Callable, Dict, Union
+
+
+@functools.lru_cache(maxsize=None)
+def _encoder() -> Callable[[Dict[str, Any]], bytes]:
+    """Pick the JSON encoder once, on first use, so importing this module stays cheap.
+
+    orjson is used when installed. Both encoders write indented UTF-8 with non-ASCII
+    text unescaped; orjson writes NaN and infinities as ``null`` and large exponents
+    as ``1e16`` rather than ``1e+16``.
+    """
+    try:  # optional C-accelerated encoder
+        import orjson
+    except ImportError:
+        import json
+
+        return lambda payload: json.dumps(payload, indent=2, ensure_ascii=False).encode()
+
+    return functools.partial(orjson.dumps, option=orjson.OPT_INDENT_2)
+
+
+def write_json(path: Union[str, "os.PathLike[str]"], payload: Dict[str, Any]) -> None:
+    """Write ``payload`` to ``path`` as indented UTF-8 JSON."""
+    with open(path, "wb") as f:
+        f.write(_encoder()(payload))
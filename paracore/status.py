@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Set
 
 from submitit.slurm import slurm
 
@@ -23,19 +24,35 @@ class JobStatus:
 
 def _infer_task(job_id: str) -> Optional[int]:
     """Infer task id from a job id if it encodes an array index."""
-    if "_" not in job_id:
-        return None
-    base, suffix = job_id.split("_", 1)
-    if not base or not suffix:
-        return None
     # Some Slurm installations use ``jobid_task``
-    try:
-        return int(suffix)
-    except ValueError:
+    base, sep, suffix = job_id.partition("_")
+    if not sep or not base or not suffix.isdecimal():
         return None
+    return int(suffix)
+
+
+def _path_exists(path: Path, dir_cache: Optional[Dict[Path, Set[str]]]) -> bool:
+    """Check whether ``path`` exists, listing its directory once per ``dir_cache``.
 
+    Without a cache this is a plain ``stat``. With one, each directory is scanned on
+    first use and later checks are set lookups, which saves a round-trip per file on
+    network filesystems when many jobs share a log directory.
+    """
+    if dir_cache is None:
+        return path.exists()
+
+    names = dir_cache.get(path.parent)
+    if names is None:
+        try:
+            with os.scandir(path.parent) as entries:
+                names = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            names = set()
+        dir_cache[path.parent] = names
+    return path.name in names
 
-def _load_job(job_id: str, log_dir: Path) -> slurm.SlurmJob:
+
+def _load_job(job_id: str, log_dir: Path) -> slurm.SlurmJob[Any]:
     """Instantiate a Submitit SlurmJob for inspection."""
     task_id = _infer_task(job_id)
     tasks = (task_id,) if task_id is not None else (0,)
@@ -47,15 +64,52 @@ def get_job_status(
     *,
     log_dir: Path,
     refresh: bool = False,
+    dir_cache: Optional[Dict[Path, Set[str]]] = None,
 ) -> JobStatus:
     """Collect status information for the given job id.
 
     This function prefers Slurm's sacct/squeue data when available but
     gracefully degrades to filesystem heuristics when those commands are
-    unavailable (e.g., during local testing).
+    unavailable (e.g., during local testing). Pass the same ``dir_cache`` dict
+    across calls to list each log directory once instead of stat-ing every file.
     """
     job = _load_job(job_id, log_dir)
+    return _status_from_job(job_id, job, refresh=refresh, dir_cache=dir_cache)
+
 
+def get_job_statuses(job_ids: Iterable[str], *, log_dir: Path) -> Dict[str, JobStatus]:
+    """Collect status information for several jobs with a single sacct call.
+
+    Loading every job first registers all of them with Submitit's shared watcher, so
+    one update queries ``sacct -j id1 -j id2 ...`` for the whole set and the per-job
+    lookups that follow read from its cache instead of each calling sacct. Log
+    directories are likewise listed once rather than stat-ing each job's files.
+    """
+    jobs = {job_id: _load_job(job_id, log_dir) for job_id in job_ids}
+
+    watchers = {}
+    for job in jobs.values():
+        watcher = getattr(job, "watcher", None)
+        if watcher is not None:
+            watchers[id(watcher)] = watcher
+    for watcher in watchers.values():
+        watcher.update()
+
+    dir_cache: Dict[Path, Set[str]] = {}
+    return {
+        job_id: _status_from_job(job_id, job, refresh=False, dir_cache=dir_cache)
+        for job_id, job in jobs.items()
+    }
+
+
+def _status_from_job(
+    job_id: str,
+    job: slurm.SlurmJob[Any],
+    *,
+    refresh: bool,
+    dir_cache: Optional[Dict[Path, Set[str]]] = None,
+) -> JobStatus:
+    """Build a ``JobStatus`` from a loaded job, falling back to its files on disk."""
     note: Optional[str] = None
     info: Dict[str, str] = {}
     state = "UNKNOWN"
@@ -73,9 +127,12 @@ def get_job_status(
         note = f"Slurm state unavailable: {exc}"
 
     # Fallback heuristics based on job artifacts
-    stdout_path = job.paths.stdout if job.paths.stdout.exists() else None
-    stderr_path = job.paths.stderr if job.paths.stderr.exists() else None
-    result_exists = job.paths.result_pickle.exists()
+    # JobPaths formats each path on every property access, so read each one once
+    paths = job.paths
+    stdout, stderr = paths.stdout, paths.stderr
+    stdout_path = stdout if _path_exists(stdout, dir_cache) else None
+    stderr_path = stderr if _path_exists(stderr, dir_cache) else None
+    result_exists = _path_exists(paths.result_pickle, dir_cache)
 
     if state == "UNKNOWN":
         if result_exists:
@@ -101,4 +158,4 @@ def get_job_status(
     )
 
 
-__all__ = ["JobStatus", "get_job_status"]
+__all__ = ["JobStatus", "get_job_status", "get_job_statuses"]
@@ -2,16 +2,379 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import shlex
+import shutil
+import signal
 import subprocess
 import tempfile
+import threading
 import time
-from typing import Any, Callable, List, Literal, Mapping, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import submitit
 
+try:
+    import resource
+except ImportError:  # pragma: no cover - POSIX only
+    resource = None  # type: ignore[assignment]
+
 from paracore.config import Config
-from paracore.types import SubmitHandle
+from paracore.types import BulkSubmitError, PilotMetrics, SubmitHandle
+
+# Peak memory line of GNU ``/usr/bin/time -v`` output
+_MAXRSS_KEY = b"Maximum resident set size (kbytes):"
+
+# Variables kept when env_merge="replace" (along with every SLURM_* variable)
+_ESSENTIAL_VARS = frozenset(
+    {
+        "PATH",
+        "HOME",
+        "USER",
+        "LOGNAME",
+        "SHELL",
+        "TERM",
+        "LD_LIBRARY_PATH",
+        "PYTHONPATH",
+        "TMPDIR",
+        "TEMP",
+        "TMP",
+        "LANG",
+        "LC_ALL",
+        "LC_CTYPE",
+        "TZ",
+        "HOSTNAME",
+    }
+)
+
+# Commands made only of plain words are started directly with posix_spawnp(), skipping
+# both the /bin/sh process and subprocess.Popen's setup. Anything the shell would
+# interpret still runs through it.
+_SPAWN = getattr(os, "posix_spawnp", None)
+_SHELL_SYNTAX = frozenset("|&;<>()$`\\\"'*?[]{}~#=%!\n")
+_SHELL_BUILTINS = frozenset(
+    {
+        ".",
+        ":",
+        "alias",
+        "builtin",
+        "cd",
+        "command",
+        "eval",
+        "exec",
+        "exit",
+        "export",
+        "hash",
+        "read",
+        "readonly",
+        "return",
+        "set",
+        "shift",
+        "source",
+        "times",
+        "trap",
+        "type",
+        "ulimit",
+        "umask",
+        "unalias",
+        "unset",
+        "wait",
+    }
+)
+# Python ignores these signals; like subprocess, restore their defaults in children
+_DEFAULT_SIGNALS = tuple(
+    getattr(signal, name) for name in ("SIGPIPE", "SIGXFZ", "SIGXFSZ") if hasattr(signal, name)
+)
+
+# Environment changes made by each env_setup command that already succeeded in this
+# worker process, keyed by the setup and the environment it ran in (a setup may read
+# variables from ``env``). A worker that runs several tasks replays them instead of
+# repeating the setup.
+_ENV_SETUP_CHANGES: Dict[Tuple[str, FrozenSet[Tuple[str, str]]], Dict[str, str]] = {}
+
+# Appended after env_setup in the sbatch script so a failed setup fails the job instead
+# of running every task in a half-configured environment
+_SETUP_STATUS_CHECK = '[ $? -eq 0 ] || { echo "env_setup failed" >&2; exit 1; }'
+
+# Shell bookkeeping variables that differ in every shell and are not part of a setup
+_SHELL_ONLY_VARS = frozenset({"_", "SHLVL", "PWD", "OLDPWD"})
+
+
+def _timed_call(fn: Callable[[Any], Any], measure_memory: bool, item: Any) -> PilotMetrics:
+    """Call ``fn(item)`` and return its result inside ``PilotMetrics``."""
+    start_ns = time.perf_counter_ns()
+    result = fn(item)
+    duration_s = (time.perf_counter_ns() - start_ns) / 1e9
+
+    max_rss_mb = None
+    if measure_memory and resource is not None:
+        # Try to get memory usage (simplified for Python functions)
+        max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    return PilotMetrics(duration_s=duration_s, max_rss_mb=max_rss_mb, result=result)
+
+
+def _make_timed(fn: Callable[[Any], Any], measure_memory: bool) -> Callable[[Any], Any]:
+    """Wrap ``fn`` so each call returns its result inside ``PilotMetrics``."""
+    return functools.partial(_timed_call, fn, measure_memory)
+
+
+def _parse_maxrss_kb(report: bytes) -> Optional[int]:
+    """Return the peak RSS in kilobytes from a ``/usr/bin/time -v`` report."""
+    start = report.find(_MAXRSS_KEY)
+    if start < 0:
+        return None
+    start += len(_MAXRSS_KEY)
+    end = report.find(b"\n", start)
+    try:
+        return int(report[start:end] if end >= 0 else report[start:])
+    except ValueError:
+        return None
+
+
+def _direct_argv(cmd: str) -> Optional[List[str]]:
+    """Split ``cmd`` into argv if it can run without a shell, else return ``None``.
+
+    Only plain words qualify: anything with quoting, expansion, redirection, pipes or
+    other shell syntax, and shell builtins, keeps going through ``/bin/sh``.
+    """
+    if _SPAWN is None or not _SHELL_SYNTAX.isdisjoint(cmd):
+        return None
+    argv = cmd.split()
+    if not argv or argv[0] in _SHELL_BUILTINS:
+        return None
+    return argv
+
+
+def _spawn(argv: List[str]) -> int:
+    """Run ``argv`` with posix_spawnp and wait for it, returning a Popen-style exit code.
+
+    The child inherits the worker's stdout and stderr, i.e. the Slurm log files.
+    """
+    spawn = _SPAWN
+    assert spawn is not None  # _direct_argv only returns argv when posix_spawnp exists
+    pid = spawn(argv[0], argv, os.environ, setsigdef=_DEFAULT_SIGNALS)
+    try:
+        _, status = os.waitpid(pid, 0)
+    except BaseException:
+        # Like subprocess.run, do not leave the child running if we are interrupted
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        raise
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _run_command(
+    cmd: str,
+    collect_metrics: bool = False,
+    measure_memory: bool = False,
+) -> Optional[PilotMetrics]:
+    """Run a shell command on the worker, optionally timing it.
+
+    Shell fallbacks pass ``close_fds=False``, which lets CPython launch them via
+    posix_spawn() instead of fork()+exec(), so spawn cost does not grow with the
+    worker's memory footprint. Nothing sensitive leaks to the child: descriptors Python
+    opens are non-inheritable by default (PEP 446), and submitit opens its logs by path.
+    """
+    start_ns = time.perf_counter_ns()
+
+    if collect_metrics and measure_memory:
+        # Use /usr/bin/time to measure resources. Its report goes to a separate
+        # file, so the command's own output streams straight to the Slurm logs
+        # instead of being buffered here
+        with tempfile.NamedTemporaryFile(delete=False) as report_file:
+            report_path = report_file.name
+        wrapped_cmd = f"/usr/bin/time -v -o {shlex.quote(report_path)} {cmd}"
+
+        try:
+            subprocess.run(
+                wrapped_cmd,
+                shell=True,
+                check=True,
+                close_fds=False,
+            )
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(
+                f"Command failed with exit code {exc.returncode}. "
+                "Check Slurm stdout/stderr logs for details."
+            ) from exc
+
+        with open(report_path, "rb") as report:
+            max_rss_kb = _parse_maxrss_kb(report.read())
+        max_rss_mb = max_rss_kb / 1024 if max_rss_kb is not None else 0.0
+
+        try:
+            os.remove(report_path)
+        except OSError:
+            pass
+
+        duration_s = (time.perf_counter_ns() - start_ns) / 1e9
+
+        return PilotMetrics(duration_s=duration_s, max_rss_mb=max_rss_mb, result=None)
+
+    argv = _direct_argv(cmd)
+    returncode = None
+    if argv is not None:
+        try:
+            returncode = _spawn(argv)
+        except OSError:
+            # e.g. the program is not on PATH; let the shell run it and report why
+            returncode = None
+
+    if returncode is None:
+        try:
+            subprocess.run(
+                cmd,
+                shell=True,
+                check=True,
+                close_fds=False,
+            )
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(
+                f"Command failed with exit code {exc.returncode}. "
+                "Check Slurm stdout/stderr logs for details."
+            ) from exc
+    elif returncode != 0:
+        raise RuntimeError(
+            f"Command failed with exit code {returncode}. "
+            "Check Slurm stdout/stderr logs for details."
+        )
+
+    if collect_metrics:
+        duration_s = (time.perf_counter_ns() - start_ns) / 1e9
+        return PilotMetrics(duration_s=duration_s, max_rss_mb=None, result=None)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _bash_path() -> str:
+    """Absolute path of bash, looked up once per worker process.
+
+    CPython only launches a program via posix_spawn() when its path has a directory
+    component, so a bare ``"bash"`` would always fork.
+    """
+    return shutil.which("bash") or "bash"
+
+
+def _env_setup_changes(env_setup: str) -> Dict[str, str]:
+    """Run ``env_setup`` in bash and return the variables it set or changed.
+
+    The setup's own output goes to stderr so that stdout carries only the resulting
+    environment, dumped NUL-separated by ``env -0``. Like ``_run_command``, bash is
+    started by absolute path with ``close_fds=False`` so it can be launched via
+    posix_spawn().
+    """
+    setup_result = subprocess.run(
+        [_bash_path(), "-c", f"{{ :\n{env_setup}\n}} >&2 && env -0"],
+        capture_output=True,
+        close_fds=False,
+    )
+    if setup_result.returncode != 0:
+        # Output stays bytes; only decode it for the error message
+        stderr = setup_result.stderr.decode(errors="replace")
+        raise RuntimeError(f"env_setup failed: {stderr}")
+
+    changes = {}
+    for entry in setup_result.stdout.split(b"\0"):
+        key, sep, value = entry.partition(b"=")
+        if not sep:
+            continue
+        name, text = os.fsdecode(key), os.fsdecode(value)
+        if name not in _SHELL_ONLY_VARS and os.environ.get(name) != text:
+            changes[name] = text
+    return changes
+
+
+def _run_with_env(
+    task_fn: Callable[..., Any],
+    env_setup: Optional[str],
+    env: Optional[Mapping[str, str]],
+    env_merge: Literal["inherit", "replace"],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """Set up the worker environment, then run ``task_fn``."""
+    # Handle environment
+    if env_merge == "replace" and env:
+        # Preserve essential system and Slurm variables
+        preserved = {
+            key: value
+            for key, value in os.environ.items()
+            if key in _ESSENTIAL_VARS or key.startswith("SLURM_")
+        }
+
+        # Apply only the differences from preserved + user env, rather than
+        # clearing and repopulating every variable
+        target = {**preserved, **env}
+        for key in os.environ.keys() - target.keys():
+            del os.environ[key]
+        for key, value in target.items():
+            if os.environ.get(key) != value:
+                os.environ[key] = value
+    elif env_merge == "inherit" and env:
+        # Merge with current environment
+        os.environ.update(env)
+
+    # Apply the environment set up by env_setup, running it once per worker process
+    if env_setup:
+        cache_key = (env_setup, frozenset(os.environ.items()))
+        changes = _ENV_SETUP_CHANGES.get(cache_key)
+        if changes is None:
+            changes = _ENV_SETUP_CHANGES[cache_key] = _env_setup_changes(env_setup)
+            os.environ.update(changes)
+            # The next task starts from the set-up environment; replaying onto it is a
+            # no-op, so it must not count as a new environment
+            _ENV_SETUP_CHANGES[(env_setup, frozenset(os.environ.items()))] = changes
+        else:
+            os.environ.update(changes)
+
+    # Run the actual task
+    return task_fn(*args, **kwargs)
+
+
+def _array_handles(jobs: List[submitit.Job[Any]], job_name: str) -> List[SubmitHandle]:
+    """Build the handles for the tasks of a submitted array, in task order."""
+    return [
+        SubmitHandle(
+            job_id=job.job_id,
+            job_name=job_name,
+            array_index=i,
+            _backend_job=job,
+        )
+        for i, job in enumerate(jobs)
+    ]
+
+
+class _RateLimiter:
+    """Space calls to ``wait`` at least ``1 / rate`` seconds apart across threads."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            time.sleep(start - now)
 
 
 class SubmititBackend:
@@ -57,6 +420,11 @@ class SubmititBackend:
                     f" ({effective_parallelism} > {max_parallelism})"
                 )
 
+        # Without an explicit value, run arrays at the configured ceiling rather than
+        # submitit's own default of 256 concurrent tasks
+        if effective_parallelism is None:
+            effective_parallelism = max_parallelism
+
         # Create executor
         executor = submitit.AutoExecutor(folder="submitit_logs")
 
@@ -92,61 +460,37 @@ class SubmititBackend:
         env_setup: Optional[str] = None,
         env: Optional[Mapping[str, str]] = None,
         env_merge: Literal["inherit", "replace"] = "inherit",
-    ) -> Callable:
-        """Create a wrapper that sets up the environment before running the task."""
-
-        def env_wrapper(task_fn: Callable) -> Callable:
-            def wrapped(*args, **kwargs):
-                # Handle environment
-                if env_merge == "replace" and env:
-                    # Preserve essential system and Slurm variables
-                    essential_vars = {
-                        "PATH",
-                        "HOME",
-                        "USER",
-                        "LOGNAME",
-                        "SHELL",
-                        "TERM",
-                        "LD_LIBRARY_PATH",
-                        "PYTHONPATH",
-                        "TMPDIR",
-                        "TEMP",
-                        "TMP",
-                        "LANG",
-                        "LC_ALL",
-                        "LC_CTYPE",
-                        "TZ",
-                        "HOSTNAME",
-                    }
-                    preserved = {}
-                    for key, value in os.environ.items():
-                        # Preserve essential vars and all Slurm-related variables
-                        if key in essential_vars or key.startswith("SLURM_"):
-                            preserved[key] = value
-
-                    # Clear and restore with preserved + user env
-                    os.environ.clear()
-                    os.environ.update(preserved)
-                    os.environ.update(env)
-                elif env_merge == "inherit" and env:
-                    # Merge with current environment
-                    os.environ.update(env)
-
-                # Run env_setup command if provided
-                if env_setup:
-                    setup_result = subprocess.run(
-                        env_setup,
-                        shell=True,
-                        capture_output=True,
-                        text=True,
-                    )
-                    if setup_result.returncode != 0:
-                        raise RuntimeError(f"env_setup failed: {setup_result.stderr}")
-
-                # Run the actual task
-                return task_fn(*args, **kwargs)
-
-            return wrapped
+        executor: Optional[submitit.AutoExecutor] = None,
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Create a wrapper that sets up the environment before running the task.
+
+        Tasks are wrapped in partials of module-level functions, so submitit pickles
+        each array task as a few references and small values instead of a closure
+        serialized by value.
+
+        On Slurm, ``env_setup`` is added to the sbatch script of ``executor`` and runs
+        once before the workers start, so tasks do not spawn a shell for it. In inherit
+        mode ``env`` is exported just ahead of it, keeping the worker's order of ``env``
+        first and the setup on top. A failed setup then fails the job instead of raising
+        in the task. The setup stays in the wrapper for other executors, and in replace
+        mode, where the worker must apply it on top of the replaced environment.
+        """
+        if (
+            env_setup
+            and executor is not None
+            and executor.cluster == "slurm"
+            and not (env_merge == "replace" and env)
+            and all(key.isascii() and key.isidentifier() for key in env or ())
+        ):
+            setup = [f"export {key}={shlex.quote(value)}" for key, value in (env or {}).items()]
+            setup += [env_setup, _SETUP_STATUS_CHECK]
+            executor.update_parameters(setup=setup)
+            # Both are applied by the script now; srun passes them on to the workers
+            env_setup = None
+            env = None
+
+        def env_wrapper(task_fn: Callable[..., Any]) -> Callable[..., Any]:
+            return functools.partial(_run_with_env, task_fn, env_setup, env, env_merge)
 
         return env_wrapper
 
@@ -187,22 +531,8 @@ class SubmititBackend:
         )
 
         # Create command runner
-        env_wrapper = self._prepare_env_wrapper(env_setup, env, env_merge)
-
-        def run_command():
-            try:
-                subprocess.run(
-                    cmd,
-                    shell=True,
-                    check=True,
-                )
-            except subprocess.CalledProcessError as exc:
-                raise RuntimeError(
-                    f"Command failed with exit code {exc.returncode}. "
-                    "Check Slurm stdout/stderr logs for details."
-                ) from exc
-
-        wrapped_fn = env_wrapper(run_command)
+        env_wrapper = self._prepare_env_wrapper(env_setup, env, env_merge, executor)
+        wrapped_fn = env_wrapper(functools.partial(_run_command, cmd))
 
         # Submit job
         job = executor.submit(wrapped_fn)
@@ -210,11 +540,56 @@ class SubmititBackend:
         return SubmitHandle(
             job_id=job.job_id,
             job_name=job_name,
-            stdout_path=str(job.paths.stdout),
-            stderr_path=str(job.paths.stderr),
             _backend_job=job,
         )
 
+    def submit_cmd_bulk(
+        self,
+        requests: Sequence[Mapping[str, Any]],
+        fanout: int = 64,
+        max_rate: Optional[float] = None,
+        submit: Optional[Callable[[Mapping[str, Any]], SubmitHandle]] = None,
+    ) -> List[SubmitHandle]:
+        """Submit independent commands concurrently.
+
+        Each request holds the keyword arguments of ``submit_cmd``, or of ``submit``
+        when given. Up to ``fanout`` ``sbatch`` calls are in flight at once, so scripted
+        bulk submission is not bounded by one scheduler round-trip per command.
+        ``max_rate`` caps how many submissions start per second, for schedulers that
+        reject bursts. Handles are returned in request order.
+
+        Every request is attempted even if some fail; failures are then raised together
+        as ``BulkSubmitError``, which carries the handles of the jobs that were submitted.
+        """
+        if fanout < 1:
+            raise ValueError("fanout must be at least 1")
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError("max_rate must be positive")
+        if not requests:
+            return []
+
+        limiter = _RateLimiter(max_rate) if max_rate is not None else None
+
+        def submit_request(request: Mapping[str, Any]) -> SubmitHandle:
+            if limiter is not None:
+                limiter.wait()
+            if submit is not None:
+                return submit(request)
+            return self.submit_cmd(**request)
+
+        with ThreadPoolExecutor(max_workers=min(fanout, len(requests))) as pool:
+            futures = [pool.submit(submit_request, request) for request in requests]
+
+        errors = {}
+        for i, future in enumerate(futures):
+            exc = future.exception()
+            if exc is not None:
+                errors[i] = exc
+        if errors:
+            handles = [None if i in errors else f.result() for i, f in enumerate(futures)]
+            raise BulkSubmitError(handles, errors) from errors[min(errors)]
+        return [f.result() for f in futures]
+
     def submit_cmd_array(
         self,
         cmds: List[str],
@@ -255,98 +630,20 @@ class SubmititBackend:
             extra=extra,
         )
 
-        # Create command runners
-        env_wrapper = self._prepare_env_wrapper(env_setup, env, env_merge)
-
-        def make_runner(cmd: str):
-            def run_command():
-                start_time = time.time()
-
-                if collect_metrics and measure_memory:
-                    # Use /usr/bin/time to measure resources
-                    wrapped_cmd = f"/usr/bin/time -v {cmd}"
-                    with tempfile.NamedTemporaryFile(delete=False) as stderr_file:
-                        stderr_path = stderr_file.name
-
-                    try:
-                        with open(stderr_path, "w") as err_stream:
-                            subprocess.run(
-                                wrapped_cmd,
-                                shell=True,
-                                check=True,
-                                stderr=err_stream,
-                            )
-                    except subprocess.CalledProcessError as exc:
-                        raise RuntimeError(
-                            f"Command failed with exit code {exc.returncode}. "
-                            "Check Slurm stdout/stderr logs for details."
-                        ) from exc
-
-                    max_rss_mb = 0.0
-                    with open(stderr_path, "r") as err_stream:
-                        for line in err_stream:
-                            if "Maximum resident set size" in line:
-                                try:
-                                    max_rss_kb = int(line.split()[-1])
-                                    max_rss_mb = max_rss_kb / 1024
-                                except (ValueError, IndexError):
-                                    continue
-
-                    try:
-                        os.remove(stderr_path)
-                    except OSError:
-                        pass
-
-                    duration_s = time.time() - start_time
-
-                    return {
-                        "_paracore_metrics": {
-                            "duration_s": duration_s,
-                            "max_rss_mb": max_rss_mb,
-                        }
-                    }
-
-                try:
-                    subprocess.run(
-                        cmd,
-                        shell=True,
-                        check=True,
-                    )
-                except subprocess.CalledProcessError as exc:
-                    raise RuntimeError(
-                        f"Command failed with exit code {exc.returncode}. "
-                        "Check Slurm stdout/stderr logs for details."
-                    ) from exc
-
-                if collect_metrics:
-                    duration_s = time.time() - start_time
-                    return {
-                        "_paracore_metrics": {
-                            "duration_s": duration_s,
-                        }
-                    }
-
-            return env_wrapper(run_command)
+        # Create command runner, shared by every task in the array
+        env_wrapper = self._prepare_env_wrapper(env_setup, env, env_merge, executor)
+        run_command = functools.partial(
+            _run_command, collect_metrics=collect_metrics, measure_memory=measure_memory
+        )
 
-        # Submit array job
-        runners = [make_runner(cmd) for cmd in cmds]
-        jobs = executor.map_array(lambda i: runners[i](), range(len(cmds)))
+        # Submit array job: submitit issues a single `sbatch --array=0-N%P` for all
+        # commands, so submission cost does not grow with one scheduler RPC per command.
+        # The commands are the array items, so each task's pickle holds the shared
+        # runner plus its own command rather than every command in the array.
+        jobs = executor.map_array(env_wrapper(run_command), cmds)
 
         # Create handles
-        handles = []
-        for i, job in enumerate(jobs):
-            handles.append(
-                SubmitHandle(
-                    job_id=job.job_id,
-                    job_name=job_name,
-                    array_index=i,
-                    stdout_path=str(job.paths.stdout),
-                    stderr_path=str(job.paths.stderr),
-                    _backend_job=job,
-                )
-            )
-
-        return handles
+        return _array_handles(jobs, job_name)
 
     def submit_func_array(
         self,
@@ -390,47 +687,13 @@ class SubmititBackend:
         )
 
         # Create wrapped function
-        env_wrapper = self._prepare_env_wrapper(env_setup, env, env_merge)
-
-        if collect_metrics:
-
-            def wrapped_fn(item):
-                start_time = time.time()
-                result = fn(item)
-                duration_s = time.time() - start_time
-
-                metrics = {"duration_s": duration_s}
-
-                if measure_memory:
-                    # Try to get memory usage (simplified for Python functions)
-                    import resource
-
-                    metrics["max_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
-
-                return {
-                    "_paracore_metrics": metrics,
-                    "result": result,
-                }
-        else:
-            wrapped_fn = fn
+        env_wrapper = self._prepare_env_wrapper(env_setup, env, env_merge, executor)
 
+        wrapped_fn = _make_timed(fn, measure_memory) if collect_metrics else fn
         final_fn = env_wrapper(wrapped_fn)
 
         # Submit array job
         jobs = executor.map_array(final_fn, items)
 
         # Create handles
-        handles = []
-        for i, job in enumerate(jobs):
-            handles.append(
-                SubmitHandle(
-                    job_id=job.job_id,
-                    job_name=job_name,
-                    array_index=i,
-                    stdout_path=str(job.paths.stdout),
-                    stderr_path=str(job.paths.stderr),
-                    _backend_job=job,
-                )
-            )
-
-        return handles
+        return _array_handles(jobs, job_name)
@@ -2,13 +2,51 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Optional
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, NamedTuple, Optional
 
+# Marks a handle whose result has not been fetched yet (``None`` is a valid result)
+_UNSET: Any = object()
 
-@dataclass
+# Seconds between done() checks while ``result()`` waits with a timeout
+_RESULT_POLL_S = 1.0
+
+
+class PilotMetrics(NamedTuple):
+    """Resource usage measured by a pilot task, returned in place of its plain result.
+
+    A named tuple, so the one returned per pilot task pickles as a bare tuple.
+    """
+
+    duration_s: float
+    max_rss_mb: Optional[float]
+    result: Any
+
+
+class BulkSubmitError(RuntimeError):
+    """Some submissions of a bulk batch failed.
+
+    ``handles`` lists the handle of every request in request order, with ``None`` for
+    the ones that failed, so jobs that did reach the cluster stay tracked. ``errors``
+    maps the position of each failed request to its exception.
+    """
+
+    def __init__(self, handles: List[Optional[SubmitHandle]], errors: Dict[int, BaseException]):
+        first = errors[min(errors)]
+        super().__init__(f"{len(errors)} of {len(handles)} bulk submissions failed: {first}")
+        self.handles = handles
+        self.errors = errors
+
+
+@dataclass(eq=False)
 class SubmitHandle:
-    """Handle to a submitted job."""
+    """Handle to a submitted job.
+
+    Handles compare and hash by ``(job_id, array_index)``, so they can key dicts that
+    join results back to inputs and collections of them dedupe cheaply.
+    """
 
     job_id: str
     job_name: str
@@ -16,12 +54,56 @@ class SubmitHandle:
     stdout_path: Optional[str] = None
     stderr_path: Optional[str] = None
     _backend_job: Any = None
+    _result_cache: Any = field(default=_UNSET, init=False, repr=False, compare=False)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SubmitHandle):
+            return NotImplemented
+        return self.job_id == other.job_id and self.array_index == other.array_index
+
+    def __hash__(self) -> int:
+        return hash((self.job_id, self.array_index))
 
     def result(self, timeout: Optional[float] = None) -> Any:
-        """Wait for and return job result."""
+        """Wait for and return job result.
+
+        The first successful result is kept on the handle, so later calls return it
+        without reading the job's result pickle again. Submitit's ``Job.result()``
+        waits without a limit, so a ``timeout`` is enforced here by polling ``done()``.
+        """
+        if self._result_cache is not _UNSET:
+            return self._result_cache
         if self._backend_job is None:
             raise RuntimeError("No backend job associated with this handle")
-        return self._backend_job.result(timeout=timeout)
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+            while not self._backend_job.done():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Job {self.job_id} still pending after {timeout}s")
+                time.sleep(min(remaining, _RESULT_POLL_S))
+        self._result_cache = self._backend_job.result()
+        return self._result_cache
+
+    async def result_async(self, poll_frequency: float = 10.0) -> Any:
+        """Wait for the job without blocking the event loop and return its result.
+
+        Lets many handles be awaited together, e.g. with ``asyncio.gather``. Checking
+        the job may run sacct and reading its result touches disk, so both run in the
+        loop's default executor.
+        """
+        if self._result_cache is not _UNSET:
+            return self._result_cache
+        if self._backend_job is None:
+            raise RuntimeError("No backend job associated with this handle")
+        loop = asyncio.get_running_loop()
+        while not await loop.run_in_executor(None, self._backend_job.done):
+            await asyncio.sleep(poll_frequency)
+        return await loop.run_in_executor(None, self.result)
+
+    def invalidate_result(self) -> None:
+        """Drop the cached result so the next ``result()`` call fetches it again."""
+        self._result_cache = _UNSET
 
     def done(self) -> bool:
         """Check if job is done."""
@@ -34,3 +116,33 @@ class SubmitHandle:
         if self._backend_job is None:
             raise RuntimeError("No backend job associated with this handle")
         self._backend_job.cancel()
+
+
+class _JobLogPath:
+    """Log path field of ``SubmitHandle`` that is derived from the backend job on first read.
+
+    Most handles are only waited on, so formatting both log paths for every job in
+    a large array at submission time is wasted work. A path passed explicitly to the
+    constructor is returned as given.
+    """
+
+    def __init__(self, stream: str):
+        self.stream = stream
+        self.name = f"{stream}_path"
+
+    def __get__(self, handle: Optional[SubmitHandle], owner: type) -> Optional[str]:
+        if handle is None:
+            return None
+        path = handle.__dict__.get(self.name)
+        if path is None and handle._backend_job is not None:
+            path = str(getattr(handle._backend_job.paths, self.stream))
+            handle.__dict__[self.name] = path
+        return path
+
+    def __set__(self, handle: SubmitHandle, path: Optional[str]) -> None:
+        handle.__dict__[self.name] = path
+
+
+# Installed after @dataclass, which would otherwise replace them with the field defaults
+SubmitHandle.stdout_path = _JobLogPath("stdout")  # type: ignore[assignment]
+SubmitHandle.stderr_path = _JobLogPath("stderr")  # type: ignore[assignment]
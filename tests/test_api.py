@@ -1,20 +1,46 @@
 """Tests for public API."""
 
-import time
-from unittest.mock import Mock, patch
+import asyncio
+import math
+import pickle
+import random
+import threading
+from unittest.mock import Mock, create_autospec, patch
 
 import pytest
-
-from paracore import SubmitHandle, autotune_from_pilot, map_cmds, map_func, run_cmd
-
-
-@patch("paracore.api.SubmititBackend")
-def test_run_cmd(mock_backend_class):
+import submitit
+
+from paracore import (
+    SubmitHandle,
+    as_completed,
+    autotune_from_pilot,
+    bulk_submit,
+    map_cmds,
+    map_func,
+    run_cmd,
+)
+from paracore.api import _invalidate_backend, _local_random, _sleep_backoff
+from paracore.types import BulkSubmitError, PilotMetrics
+
+
+@pytest.fixture(autouse=True)
+def backend_class(monkeypatch):
+    """Replace SubmititBackend with a mock class and drop any cached backend."""
+    backend_class = Mock(return_value=Mock())
+    monkeypatch.setattr("paracore.api.SubmititBackend", backend_class)
+    _invalidate_backend()
+    yield backend_class
+    _invalidate_backend()
+
+
+@pytest.fixture
+def mock_backend(backend_class):
+    """The backend instance that API calls submit through."""
+    return backend_class.return_value
+
+
+def test_run_cmd(mock_backend):
     """Test run_cmd function."""
-    # Setup mock
-    mock_backend = Mock()
-    mock_backend_class.return_value = mock_backend
-
     mock_handle = SubmitHandle(
         job_id="12345",
         job_name="test-job",
@@ -44,13 +70,8 @@ def test_run_cmd(mock_backend_class):
     assert call_kwargs["time_min"] == 30
 
 
-@patch("paracore.api.SubmititBackend")
-def test_map_cmds(mock_backend_class):
+def test_map_cmds(mock_backend):
     """Test map_cmds function."""
-    # Setup mock
-    mock_backend = Mock()
-    mock_backend_class.return_value = mock_backend
-
     mock_handles = [
         SubmitHandle(job_id=f"1234{i}", job_name="array-job", array_index=i) for i in range(3)
     ]
@@ -76,13 +97,8 @@ def test_map_cmds(mock_backend_class):
     assert call_kwargs["array_parallelism"] == 10
 
 
-@patch("paracore.api.SubmititBackend")
-def test_map_func(mock_backend_class):
+def test_map_func(mock_backend):
     """Test map_func function."""
-    # Setup mock
-    mock_backend = Mock()
-    mock_backend_class.return_value = mock_backend
-
     mock_handles = [
         SubmitHandle(job_id=f"2345{i}", job_name="func-job", array_index=i) for i in range(5)
     ]
@@ -111,13 +127,81 @@ def test_map_func(mock_backend_class):
     assert call_kwargs["items"] == items
 
 
-@patch("paracore.api.SubmititBackend")
-def test_retry_logic(mock_backend_class):
-    """Test retry logic on failure."""
-    # Setup mock
-    mock_backend = Mock()
-    mock_backend_class.return_value = mock_backend
+def test_bulk_submit(mock_backend):
+    """Commands queued in a bulk block should be submitted together on exit."""
+    mock_backend.submit_cmd_bulk.return_value = [
+        SubmitHandle(job_id=str(i), job_name="bulk") for i in range(3)
+    ]
+
+    with bulk_submit(fanout=8) as bulk:
+        positions = [bulk.run_cmd(f"echo {i}", partition="short") for i in range(3)]
+        mock_backend.submit_cmd_bulk.assert_not_called()
+
+    assert positions == [0, 1, 2]
+    assert [h.job_id for h in bulk.handles] == ["0", "1", "2"]
+    (requests,) = mock_backend.submit_cmd_bulk.call_args.args
+    assert [r["cmd"] for r in requests] == ["echo 0", "echo 1", "echo 2"]
+    assert requests[0]["partition"] == "short"
+    assert mock_backend.submit_cmd_bulk.call_args.kwargs["fanout"] == 8
+
+
+def test_bulk_submit_applies_retries_and_rejects_unknown_options(mock_backend):
+    """Queued commands get run_cmd's retries; unknown options fail when queued."""
+    mock_backend.submit_cmd_bulk.return_value = [SubmitHandle(job_id="1", job_name="bulk")]
+    with bulk_submit() as bulk:
+        with pytest.raises(TypeError):
+            bulk.run_cmd("echo 0", not_an_option=1)
+        bulk.run_cmd("echo 1", retries=1, retry_backoff_s=0, jitter_s=0)
+
+    (requests,) = mock_backend.submit_cmd_bulk.call_args.args
+    submit = mock_backend.submit_cmd_bulk.call_args.kwargs["submit"]
+    handle = SubmitHandle(job_id="1", job_name="bulk")
+    mock_backend.submit_cmd.side_effect = [RuntimeError("sbatch busy"), handle]
+
+    assert submit(requests[0]) is handle
+    assert mock_backend.submit_cmd.call_count == 2
+    assert "retries" not in mock_backend.submit_cmd.call_args.kwargs
+
+
+def test_bulk_submit_keeps_handles_of_partial_failure(mock_backend):
+    """Handles of the submissions that went through should survive a partial failure."""
+    handle = SubmitHandle(job_id="1", job_name="bulk")
+    mock_backend.submit_cmd_bulk.side_effect = BulkSubmitError(
+        [handle, None], {1: RuntimeError("boom")}
+    )
+
+    with pytest.raises(BulkSubmitError, match="1 of 2"), bulk_submit() as bulk:
+        bulk.run_cmd("echo 1")
+        bulk.run_cmd("echo 2")
+
+    assert bulk.handles == [handle, None]
+
+
+def test_bulk_submit_skips_submission_on_error(mock_backend):
+    """Nothing should be submitted when the bulk block raises."""
+    with pytest.raises(RuntimeError), bulk_submit() as bulk:
+        bulk.run_cmd("echo 1")
+        raise RuntimeError("abort")
+
+    mock_backend.submit_cmd_bulk.assert_not_called()
+    assert bulk.handles == []
+
+
+def test_backend_is_reused_across_calls(backend_class):
+    """Consecutive calls should share one backend until it is invalidated."""
+    backend_class.side_effect = lambda config: Mock(config=config)
+
+    run_cmd("echo 1")
+    map_cmds(["echo 2", "echo 3"])
+    assert backend_class.call_count == 1
+
+    _invalidate_backend()
+    run_cmd("echo 4")
+    assert backend_class.call_count == 2
+
 
+def test_retry_logic(mock_backend):
+    """Test retry logic on failure."""
     # First two calls fail, third succeeds
     mock_backend.submit_cmd.side_effect = [
         Exception("Network error"),
@@ -126,37 +210,89 @@ def test_retry_logic(mock_backend_class):
     ]
 
     # Call with retries
-    start_time = time.time()
-    result = run_cmd(
-        "echo retry",
-        retries=2,
-        retry_backoff_s=0.1,  # Short backoff for testing
-    )
-    elapsed = time.time() - start_time
+    with patch("paracore.api.time.sleep") as mock_sleep:
+        result = run_cmd(
+            "echo retry",
+            retries=2,
+            retry_backoff_s=0.1,  # Short backoff for testing
+        )
 
     # Verify
     assert result.job_id == "99999"
     assert mock_backend.submit_cmd.call_count == 3
-    assert elapsed >= 0.3  # At least 0.1 + 0.2 backoff
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert len(delays) == 2
+    assert 0 <= delays[0] <= 0.1  # Full jitter up to 0.1 * 2**0
+    assert 0 <= delays[1] <= 0.2  # Full jitter up to 0.1 * 2**1
 
 
-@patch("paracore.api.SubmititBackend")
-def test_autotune_from_pilot(mock_backend_class):
-    """Test autotune_from_pilot function."""
-    # Setup mock
-    mock_backend = Mock()
-    mock_backend_class.return_value = mock_backend
+def test_jitter_only_sleeps_when_requested():
+    """Submission jitter should sleep at most jitter_s, and not at all when disabled."""
+    with patch("paracore.api.time.sleep") as mock_sleep:
+        run_cmd("echo 1")
+        mock_sleep.assert_not_called()
+
+        run_cmd("echo 2", jitter_s=5.0)
+        mock_sleep.assert_called_once()
+        assert 0 <= mock_sleep.call_args.args[0] <= 5.0
+
+
+def test_retry_does_not_swallow_keyboard_interrupt(mock_backend):
+    """Ctrl-C during submission should propagate immediately, without retrying."""
+    mock_backend.submit_cmd.side_effect = KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run_cmd("echo 1", retries=3, retry_backoff_s=0.01)
+
+    assert mock_backend.submit_cmd.call_count == 1
+
+
+def test_local_random_is_per_thread():
+    """Each thread should get its own generator, reused across calls."""
+    main_rng = _local_random()
+    assert _local_random() is main_rng
+
+    other = []
+    worker = threading.Thread(target=lambda: other.append(_local_random()))
+    worker.start()
+    worker.join()
+    assert other[0] is not main_rng
+
+
+def test_sleep_backoff_is_capped_and_seedable():
+    """Backoff delays should be reproducible with a seeded RNG and never exceed cap."""
+    with patch("paracore.api.time.sleep") as mock_sleep:
+        for attempt in range(12):
+            _sleep_backoff(attempt, 1.0, cap=60.0, rng=random.Random(7))
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+
+    assert all(0 <= d <= 60.0 for d in delays)
+    assert delays[0] == random.Random(7).uniform(0, 1.0)
+    assert delays[-1] == random.Random(7).uniform(0, 60.0)
+
+
+def test_map_cmds_retry_resubmits_generator_input(mock_backend):
+    """A retried submission should see the full input even when it was a generator."""
+    mock_backend.submit_cmd_array.side_effect = [Exception("Timeout"), []]
+
+    map_cmds((f"echo {i}" for i in range(3)), retries=1, retry_backoff_s=0.01)
+
+    assert mock_backend.submit_cmd_array.call_count == 2
+    for call in mock_backend.submit_cmd_array.call_args_list:
+        assert call.kwargs["cmds"] == ["echo 0", "echo 1", "echo 2"]
+
 
+def test_autotune_from_pilot(mock_backend):
+    """Test autotune_from_pilot function."""
     # Mock pilot job results
     mock_jobs = []
     for i in range(5):
         job = Mock()
-        job.result.return_value = {
-            "_paracore_metrics": {
-                "duration_s": 45 + i * 5,  # 45, 50, 55, 60, 65
-                "max_rss_mb": 1000 + i * 100,  # 1000-1400 MB
-            }
-        }
+        job.result.return_value = PilotMetrics(
+            duration_s=45 + i * 5,  # 45, 50, 55, 60, 65
+            max_rss_mb=1000 + i * 100,  # 1000-1400 MB
+            result=None,
+        )
         mock_jobs.append(job)
 
     mock_backend.submit_cmd_array.return_value = mock_jobs
@@ -180,18 +316,10 @@ def test_autotune_from_pilot(mock_backend_class):
     assert "array_parallelism" in suggestions
 
 
-@patch("paracore.api.SubmititBackend")
-def test_autotune_time_only_collects_duration(mock_backend_class):
+def test_autotune_time_only_collects_duration(mock_backend):
     """Time-only measurement should still produce duration-informed suggestions."""
-    mock_backend = Mock()
-    mock_backend_class.return_value = mock_backend
-
     job = Mock()
-    job.result.return_value = {
-        "_paracore_metrics": {
-            "duration_s": 120,
-        }
-    }
+    job.result.return_value = PilotMetrics(duration_s=120, max_rss_mb=None, result=None)
     mock_backend.submit_cmd_array.return_value = [job]
 
     suggestions = autotune_from_pilot(
@@ -209,9 +337,213 @@ def test_autotune_time_only_collects_duration(mock_backend_class):
     assert suggestions["mem_gb"] == 2
 
 
+def test_autotune_blocking_fraction_cancels_stragglers(mock_backend):
+    """Once the quorum of pilots finished, the rest should be cancelled."""
+    mock_jobs = []
+    for i in range(5):
+        job = Mock()
+        job.done.return_value = i < 3
+        job.result.return_value = PilotMetrics(duration_s=60, max_rss_mb=512, result=None)
+        mock_jobs.append(job)
+    mock_backend.submit_cmd_array.return_value = mock_jobs
+
+    suggestions = autotune_from_pilot(
+        [f"cmd {i}" for i in range(5)],
+        runner="cmds",
+        sample_size=5,
+        blocking_fraction=0.6,
+    )
+
+    for job in mock_jobs[:3]:
+        job.result.assert_called_once()
+        job.cancel.assert_not_called()
+    for job in mock_jobs[3:]:
+        job.result.assert_not_called()
+        job.cancel.assert_called_once()
+    assert suggestions["_info"] == "Based on 3/5 successful pilot jobs."
+
+
+def test_autotune_fetches_pilot_results_concurrently(mock_backend):
+    """Pilot result reads should overlap instead of running one after another."""
+    # Each read waits for all the others, so serial fetching would break the barrier
+    barrier = threading.Barrier(4, timeout=5)
+
+    def read_result():
+        barrier.wait()
+        return PilotMetrics(duration_s=60, max_rss_mb=512, result=None)
+
+    mock_jobs = []
+    for _ in range(4):
+        job = Mock()
+        job.done.return_value = True
+        job.result.side_effect = read_result
+        mock_jobs.append(job)
+    mock_backend.submit_cmd_array.return_value = mock_jobs
+
+    suggestions = autotune_from_pilot(
+        [f"cmd {i}" for i in range(4)],
+        runner="cmds",
+        sample_size=4,
+    )
+
+    assert suggestions["time_min"] == 2
+    assert "_info" not in suggestions
+
+
+def test_autotune_uses_p95_duration(mock_backend):
+    """time_min should follow the 95th percentile pilot duration plus margin."""
+    mock_jobs = []
+    for minutes in random.sample(range(1, 101), 100):
+        job = Mock()
+        job.done.return_value = True
+        job.result.return_value = PilotMetrics(
+            duration_s=minutes * 60, max_rss_mb=None, result=None
+        )
+        mock_jobs.append(job)
+    mock_backend.submit_cmd_array.return_value = mock_jobs
+
+    suggestions = autotune_from_pilot(
+        [f"cmd {i}" for i in range(100)],
+        runner="cmds",
+        sample_size=100,
+        measurement="time_only",
+    )
+
+    assert suggestions["time_min"] == math.ceil(96 * 1.3)
+
+
+@pytest.mark.parametrize(
+    ("oom_tolerance", "expected_rss_mb"),
+    [("minimal", 10240), ("low", 10240), ("medium", 7168)],
+)
+def test_autotune_oom_tolerance_selects_rss_percentile(
+    mock_backend, oom_tolerance, expected_rss_mb
+):
+    """mem_gb should be sized from the RSS statistic matching the OOM tolerance."""
+    mock_jobs = []
+    for gb in range(1, 11):
+        job = Mock()
+        job.done.return_value = True
+        job.result.return_value = PilotMetrics(duration_s=60, max_rss_mb=gb * 1024, result=None)
+        mock_jobs.append(job)
+    mock_backend.submit_cmd_array.return_value = mock_jobs
+
+    suggestions = autotune_from_pilot(
+        [f"cmd {i}" for i in range(10)],
+        runner="cmds",
+        sample_size=10,
+        oom_tolerance=oom_tolerance,
+    )
+
+    assert suggestions["mem_gb"] == math.ceil(expected_rss_mb * 1.3 / 1024)
+
+
+def test_autotune_rejects_unknown_oom_tolerance():
+    """Unknown OOM tolerance levels should be rejected up front."""
+    with pytest.raises(ValueError, match="oom_tolerance"):
+        autotune_from_pilot(["cmd"], runner="cmds", oom_tolerance="high")
+
+
+def test_autotune_func_runner_submits_function_array(mock_backend):
+    """The func runner should map fn over the sampled items."""
+    job = Mock()
+    job.result.return_value = PilotMetrics(duration_s=30, max_rss_mb=None, result=1)
+    mock_backend.submit_func_array.return_value = [job]
+
+    autotune_from_pilot([1], runner="func", fn=abs, measurement="time_only")
+
+    mock_backend.submit_cmd_array.assert_not_called()
+    call_kwargs = mock_backend.submit_func_array.call_args.kwargs
+    assert call_kwargs["fn"] is abs
+    assert call_kwargs["items"] == [1]
+    assert call_kwargs["measure_memory"] is False
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"runner": "func"}, "fn must be provided"),
+        ({"runner": "container"}, "Unknown runner"),
+        ({"runner": "cmds", "measurement": "rss_only"}, "Unknown measurement"),
+    ],
+)
+def test_autotune_rejects_invalid_runner_options(backend_class, kwargs, message):
+    """Invalid runner options should fail before anything is submitted."""
+    with pytest.raises(ValueError, match=message):
+        autotune_from_pilot(["cmd"], **kwargs)
+
+    backend_class.assert_not_called()
+
+
+def test_autotune_rejects_invalid_blocking_fraction():
+    """blocking_fraction outside (0, 1] should be rejected up front."""
+    with pytest.raises(ValueError, match="blocking_fraction"):
+        autotune_from_pilot(["cmd"], runner="cmds", blocking_fraction=0)
+
+
+def test_as_completed_yields_in_completion_order():
+    """Handles should be yielded as they finish, not in submission order."""
+    slow_job = Mock()
+    slow_job.done.side_effect = [False, False, True]
+    fast_job = Mock()
+    fast_job.done.return_value = True
+
+    slow = SubmitHandle(job_id="1_0", job_name="test", array_index=0, _backend_job=slow_job)
+    fast = SubmitHandle(job_id="1_1", job_name="test", array_index=1, _backend_job=fast_job)
+
+    order = [handle.job_id for handle in as_completed([slow, fast], poll_frequency=0)]
+
+    assert order == ["1_1", "1_0"]
+    assert fast_job.done.call_count == 1
+
+
+def test_as_completed_refreshes_shared_watcher_once_per_tick():
+    """Jobs sharing a watcher should trigger a single status refresh per tick."""
+    watcher = Mock()
+    handles = []
+    for i in range(5):
+        job = Mock()
+        job.watcher = watcher
+        job.done.side_effect = [False, True]
+        handles.append(SubmitHandle(job_id=f"7_{i}", job_name="test", _backend_job=job))
+
+    finished = list(as_completed(handles, poll_frequency=0))
+
+    assert len(finished) == 5
+    assert watcher.update.call_count == 2
+
+
+def test_as_completed_poll_window_bounds_checks_per_tick():
+    """Only poll_window handles should be checked per tick, rotating through the rest."""
+    jobs = []
+    handles = []
+    for i in range(5):
+        job = Mock()
+        job.done.return_value = True
+        jobs.append(job)
+        handles.append(SubmitHandle(job_id=str(i), job_name="test", _backend_job=job))
+
+    stream = as_completed(handles, poll_frequency=0, poll_window=2)
+    first_tick = [next(stream), next(stream)]
+
+    assert [h.job_id for h in first_tick] == ["0", "1"]
+    assert [job.done.call_count for job in jobs] == [1, 1, 0, 0, 0]
+    assert [h.job_id for h in stream] == ["2", "3", "4"]
+
+
+def test_as_completed_timeout():
+    """Pending jobs past the timeout should raise TimeoutError."""
+    job = Mock()
+    job.done.return_value = False
+    handle = SubmitHandle(job_id="1", job_name="test", _backend_job=job)
+
+    with pytest.raises(TimeoutError, match="1 jobs still pending"):
+        list(as_completed([handle], timeout=0, poll_frequency=0))
+
+
 def test_submit_handle_methods():
     """Test SubmitHandle methods."""
-    mock_job = Mock()
+    mock_job = create_autospec(submitit.Job, instance=True)
     mock_job.result.return_value = "test result"
     mock_job.done.return_value = True
 
@@ -223,7 +555,7 @@ def test_submit_handle_methods():
 
     # Test result
     assert handle.result() == "test result"
-    mock_job.result.assert_called_once_with(timeout=None)
+    mock_job.result.assert_called_once_with()
 
     # Test done
     assert handle.done() is True
@@ -234,6 +566,104 @@ def test_submit_handle_methods():
     mock_job.cancel.assert_called_once()
 
 
+def test_pilot_metrics_pickle_round_trip():
+    """Pilot metrics must survive the result pickle intact and stay compact."""
+    metrics = PilotMetrics(duration_s=12.5, max_rss_mb=256.0, result={"rows": 3})
+
+    restored = pickle.loads(pickle.dumps(metrics))
+    assert restored == metrics
+    assert restored.result == {"rows": 3}
+    assert not hasattr(metrics, "__dict__")
+
+
+def test_submit_handle_identity_is_job_id_and_index():
+    """Handles for the same job and array index should compare equal and dedupe in sets."""
+    first = SubmitHandle(job_id="123_0", job_name="a", stdout_path="/logs/out")
+    again = SubmitHandle(job_id="123_0", job_name="a")
+    other = SubmitHandle(job_id="123_1", job_name="a")
+
+    assert first == again
+    assert first != other
+    assert len({first, again, other}) == 2
+
+    task = SubmitHandle(job_id="123_0", job_name="a", array_index=0)
+    assert task != first
+    assert {task: "input-0"}[SubmitHandle(job_id="123_0", job_name="b", array_index=0)] == "input-0"
+
+
+def test_submit_handle_caches_result():
+    """Repeated result() calls should only fetch from the backend once."""
+    mock_job = Mock()
+    mock_job.result.return_value = {"value": 42}
+
+    handle = SubmitHandle(job_id="123", job_name="test", _backend_job=mock_job)
+
+    assert handle.result() == {"value": 42}
+    assert handle.result() == {"value": 42}
+    mock_job.result.assert_called_once()
+
+    handle.invalidate_result()
+    handle.result()
+    assert mock_job.result.call_count == 2
+
+    with pytest.raises(TypeError):
+        SubmitHandle(job_id="123", job_name="test", _result_cache="stale")
+
+
+def test_submit_handle_does_not_cache_failures():
+    """A failed fetch should be retried on the next result() call."""
+    mock_job = Mock()
+    mock_job.result.side_effect = [RuntimeError("boom"), "ok"]
+
+    handle = SubmitHandle(job_id="123", job_name="test", _backend_job=mock_job)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        handle.result()
+    assert handle.result() == "ok"
+
+
+def test_submit_handle_result_async_gather():
+    """result_async should let several handles be awaited concurrently."""
+    handles = []
+    for i in range(3):
+        job = Mock()
+        job.done.side_effect = [False, True]
+        job.result.return_value = i * 10
+        handles.append(SubmitHandle(job_id=str(i), job_name="test", _backend_job=job))
+
+    async def gather_all():
+        return await asyncio.gather(*(h.result_async(poll_frequency=0) for h in handles))
+
+    assert asyncio.run(gather_all()) == [0, 10, 20]
+
+
+def test_submit_handle_result_timeout_polls_done():
+    """A timeout should be enforced by polling done(), not passed to submitit."""
+    mock_job = create_autospec(submitit.Job, instance=True)
+    mock_job.done.return_value = False
+
+    handle = SubmitHandle(job_id="123", job_name="test", _backend_job=mock_job)
+    with pytest.raises(TimeoutError, match="123"):
+        handle.result(timeout=0)
+    mock_job.result.assert_not_called()
+
+    mock_job.done.return_value = True
+    mock_job.result.return_value = "late"
+    assert handle.result(timeout=5) == "late"
+    mock_job.result.assert_called_once_with()
+
+
+def test_submit_handle_result_async_with_spec_job():
+    """result_async should work against the real submitit Job signatures."""
+    mock_job = create_autospec(submitit.Job, instance=True)
+    mock_job.done.side_effect = [False, True]
+    mock_job.result.return_value = "done"
+
+    handle = SubmitHandle(job_id="123", job_name="test", _backend_job=mock_job)
+    assert asyncio.run(handle.result_async(poll_frequency=0)) == "done"
+    mock_job.result.assert_called_once_with()
+
+
 def test_submit_handle_no_backend():
     """Test SubmitHandle without backend job raises errors."""
     handle = SubmitHandle(job_id="123", job_name="test")
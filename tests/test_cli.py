@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import io
+import threading
 from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
-from paracore.cli import cmd_status
+from paracore.cli import (
+    _build_parser,
+    cmd_batch,
+    cmd_status,
+    main,
+    parse_env_vars,
+    read_commands,
+)
 from paracore.status import JobStatus
 
 
@@ -32,7 +42,8 @@ def test_cmd_status_prints_status(monkeypatch, capsys, tmp_path):
     }
 
     monkeypatch.setattr(
-        "paracore.cli.get_job_status", lambda job_id, log_dir, refresh=False: statuses[job_id]
+        "paracore.status.get_job_statuses",
+        lambda job_ids, log_dir: {job_id: statuses[job_id] for job_id in job_ids},
     )
 
     args = SimpleNamespace(job_ids=["123", "456"], log_dir=str(tmp_path), refresh=False)
@@ -46,6 +57,37 @@ def test_cmd_status_prints_status(monkeypatch, capsys, tmp_path):
     assert "note:" in out
 
 
+def test_cmd_status_reports_failing_id_alongside_good_ones(monkeypatch, capsys, tmp_path):
+    """A failed batch lookup should fall back to per-id lookups and exit 1 at the end."""
+
+    def fail_batch(job_ids, log_dir):
+        raise RuntimeError("batch failed")
+
+    def get_one(job_id, log_dir, refresh):
+        if job_id == "bad":
+            raise ValueError("no such job")
+        return JobStatus(
+            job_id=job_id,
+            state="COMPLETED",
+            info={},
+            stdout_path=None,
+            stderr_path=None,
+        )
+
+    monkeypatch.setattr("paracore.status.get_job_statuses", fail_batch)
+    monkeypatch.setattr("paracore.status.get_job_status", get_one)
+
+    args = SimpleNamespace(job_ids=["123", "bad", "456"], log_dir=str(tmp_path), refresh=False)
+    with pytest.raises(SystemExit) as exc:
+        cmd_status(args)
+
+    assert exc.value.code == 1
+    captured = capsys.readouterr()
+    assert "123: COMPLETED" in captured.out
+    assert "456: COMPLETED" in captured.out
+    assert "bad: unable to load status (no such job)" in captured.err
+
+
 def test_cmd_status_requires_job_ids(capsys):
     """cmd_status should exit with code 1 when no job ids are provided."""
     args = SimpleNamespace(job_ids=[], log_dir="submitit_logs", refresh=False)
@@ -56,3 +98,122 @@ def test_cmd_status_requires_job_ids(capsys):
     assert exc.value.code == 1
     err = capsys.readouterr().err
     assert "Provide at least one job id" in err
+
+
+def test_read_commands_from_file_and_stdin(monkeypatch, tmp_path):
+    """Commands should be stripped and blank lines dropped for files and stdin alike."""
+    data = b"echo 1\r\n\n   \n  echo 2  \necho 3"
+    path = tmp_path / "cmds.txt"
+    path.write_bytes(data)
+
+    assert read_commands(str(path)) == ["echo 1", "echo 2", "echo 3"]
+
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(data)))
+    assert read_commands("-") == ["echo 1", "echo 2", "echo 3"]
+
+
+def _batch_args(path, **overrides):
+    args = {
+        "file": str(path),
+        "name": None,
+        "partition": None,
+        "time": None,
+        "cpus": None,
+        "memory": None,
+        "env_setup": None,
+        "env": None,
+        "env_merge": "inherit",
+        "array_parallelism": None,
+        "account": None,
+        "qos": None,
+        "retries": 0,
+        "retry_backoff": 30.0,
+        "wait": True,
+        "wait_timeout": None,
+    }
+    args.update(overrides)
+    return SimpleNamespace(**args)
+
+
+def test_cmd_batch_wait_reports_failures(monkeypatch, capsys, tmp_path):
+    """Waiting on a batch should count None results as successes and list failures."""
+    path = tmp_path / "cmds.txt"
+    path.write_text("echo 1\necho 2\nexit 1\n")
+
+    jobs = [Mock(job_id=f"42_{i}") for i in range(3)]
+    for job in jobs:
+        job.result.return_value = None
+    jobs[2].result.side_effect = RuntimeError("boom")
+    monkeypatch.setattr("paracore.api.map_cmds", lambda **kwargs: jobs)
+
+    with pytest.raises(SystemExit) as exc:
+        cmd_batch(_batch_args(path))
+
+    assert exc.value.code == 1
+    captured = capsys.readouterr()
+    assert "Completed 2 jobs successfully" in captured.out
+    assert "Job 2 (42_2): boom" in captured.err
+    assert captured.err.startswith("Failed 1 jobs\n")
+
+
+def test_cmd_batch_reports_progress_every_ten_jobs(monkeypatch, capsys, tmp_path):
+    """Progress lines should keep their every-10-completions cadence."""
+    path = tmp_path / "cmds.txt"
+    path.write_text("echo\n" * 25)
+
+    jobs = [Mock(job_id=f"42_{i}") for i in range(25)]
+    for job in jobs:
+        job.result.return_value = None
+    monkeypatch.setattr("paracore.api.map_cmds", lambda **kwargs: jobs)
+
+    cmd_batch(_batch_args(path))
+
+    out = capsys.readouterr().out
+    assert "Completed 10/25 jobs\nCompleted 20/25 jobs\n" in out
+    assert "Completed 25 jobs successfully" in out
+
+
+def test_cmd_batch_waits_on_jobs_concurrently(monkeypatch, capsys, tmp_path):
+    """A slow job early in the batch should not hold up waiting on the others."""
+    path = tmp_path / "cmds.txt"
+    path.write_text("echo 1\necho 2\necho 3\n")
+
+    # Every wait blocks until all three are waiting, so serial waiting would fail
+    barrier = threading.Barrier(3, timeout=5)
+    jobs = [Mock(job_id=f"7_{i}") for i in range(3)]
+    for job in jobs:
+        job.result.side_effect = lambda timeout=None: barrier.wait()
+    monkeypatch.setattr("paracore.api.map_cmds", lambda **kwargs: jobs)
+
+    cmd_batch(_batch_args(path))
+
+    assert "Completed 3 jobs successfully" in capsys.readouterr().out
+
+
+def test_main_reuses_parser_across_invocations(monkeypatch, capsys):
+    """Repeated main() calls should parse with the same cached parser."""
+    submitted = []
+
+    def fake_run_cmd(cmd, **kwargs):
+        submitted.append(cmd)
+        return SimpleNamespace(job_id="1", job_name="job", stdout_path=None, stderr_path=None)
+
+    monkeypatch.setattr("paracore.api.run_cmd", fake_run_cmd)
+
+    main(["run", "echo a"])
+    main(["run", "echo b", "--time", "5"])
+
+    assert submitted == ["echo a", "echo b"]
+    assert _build_parser() is _build_parser()
+    assert capsys.readouterr().out.count("Submitted job 1") == 2
+
+
+def test_parse_env_vars_warns_once_for_invalid_items(capsys):
+    """Valid pairs should be parsed and all invalid items reported in one warning."""
+    env = parse_env_vars(["A=1", "oops", "B=x=y", "also-bad", "A=2"])
+
+    assert env == {"A": "2", "B": "x=y"}
+    err = capsys.readouterr().err
+    assert err.count("Warning") == 1
+    assert "'oops', 'also-bad'" in err
+    assert parse_env_vars(None) == {}
@@ -1,9 +1,11 @@
 """Tests for configuration system."""
 
+from unittest.mock import patch
+
 import pytest
 import yaml
 
-from paracore.config import Config
+from paracore.config import Config, _load_yaml_cached
 
 
 def test_default_config():
@@ -128,3 +130,113 @@ def test_unknown_cluster():
 
     with pytest.raises(ValueError, match="Unknown cluster"):
         config.get_cluster_config("nonexistent")
+
+
+def test_cluster_config_is_merged_once():
+    """Repeated lookups should reuse the merged cluster config."""
+    config = Config()
+    config._config["clusters"]["hpc2"] = {"slurm": {"partition": "gpu"}}
+
+    first = config.get_cluster_config("hpc2")
+    assert first["slurm"]["partition"] == "gpu"
+    assert first["slurm"]["cpus_per_task"] == 4  # merged from default
+
+    assert config.get_cluster_config("hpc2") is first
+
+
+def test_yaml_cache_reparses_only_changed_files(tmp_path):
+    """Unchanged config files should be parsed once and handed out as copies."""
+    path = tmp_path / "paracore.yaml"
+    path.write_text("active_cluster: hpc1\n")
+
+    with patch("paracore.config.yaml.load", wraps=yaml.load) as yaml_load:
+        first = _load_yaml_cached(path)
+        first["active_cluster"] = "mutated"
+        assert _load_yaml_cached(path) == {"active_cluster": "hpc1"}
+        assert yaml_load.call_count == 1
+
+        path.write_text("active_cluster: hpc2-updated\n")
+        assert _load_yaml_cached(path) == {"active_cluster": "hpc2-updated"}
+        assert yaml_load.call_count == 2
+
+    assert _load_yaml_cached(tmp_path / "missing.yaml") is None
+
+
+def test_merge_configs_leaves_inputs_untouched():
+    """Nested merges should not write through to the base or overlay dicts."""
+    config = Config()
+    base = {"slurm": {"partition": "compute", "extra": {"gres": "gpu:1"}}, "env": None}
+    overlay = {"slurm": {"extra": {"constraint": "a100"}}, "env": "conda"}
+
+    merged = config._merge_configs(base, overlay)
+
+    assert merged == {
+        "slurm": {"partition": "compute", "extra": {"gres": "gpu:1", "constraint": "a100"}},
+        "env": "conda",
+    }
+    assert base["slurm"]["extra"] == {"gres": "gpu:1"}
+    assert base["env"] is None
+    assert overlay == {"slurm": {"extra": {"constraint": "a100"}}, "env": "conda"}
+
+
+def test_resolve_reuses_baseline_without_leaking_overrides():
+    """Test that resolve caches its baseline but never mutates it."""
+    config = Config()
+
+    first = config.resolve(partition="custom", extra={"constraint": "haswell"}, jitter_s=5)
+    second = config.resolve(extra=None, array_parallelism=None, foo="bar")
+
+    assert first["partition"] == "custom"
+    assert first["start_jitter_s"] == 5
+    assert second["partition"] == config.resolve()["partition"]
+    assert second["extra"] == {}
+    assert second["foo"] == "bar"
+    assert "array_parallelism" not in second
+    assert config._resolve_baselines[None]["extra"] == {}
+
+
+def test_config_precomputes_naming_settings():
+    """Test that naming settings are read once and instances carry no __dict__."""
+    config = Config()
+
+    assert not hasattr(config, "__dict__")
+    assert config.get_active_cluster() == config._config.get("active_cluster", "default")
+    assert config.format_job_name(None) == config.format_job_name(config._default_template)
+    assert len(config.format_job_name("x" * 200)) == config._max_len
+
+
+def test_format_job_name_skips_context_without_placeholders():
+    """Test that plain job names are not formatted against the cluster config."""
+    config = Config()
+
+    with patch.object(Config, "get_cluster_config") as mock_cluster_config:
+        assert config.format_job_name("plain name") == "plain-name"
+        mock_cluster_config.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("my job/run 1", "my-job-run-1"),
+        ("--a!!__b--", "a-__b"),
+        ("caféé résumé", "caf-r-sum"),
+        ("日本 job", "job"),
+        ("!!!", "paracore-job"),
+    ],
+)
+def test_format_job_name_sanitizes_every_disallowed_character(name, expected):
+    """Test that sanitization maps any non [A-Za-z0-9_-] character, ASCII or not, to a dash."""
+    assert Config().format_job_name(name) == expected
+
+
+def test_format_job_name_caches_per_name_and_context():
+    """Test that repeated names are formatted once per distinct context."""
+    config = Config()
+
+    with patch.object(Config, "_format_job_name", return_value="cached") as mock_format:
+        assert config.format_job_name("job-{partition}", partition="short") == "cached"
+        assert config.format_job_name("job-{partition}", partition="short") == "cached"
+        config.format_job_name("job-{partition}", partition="long")
+        config.format_job_name("job", extra=["unhashable"])
+
+    assert mock_format.call_count == 3
@@ -0,0 +1,31 @@
+"""Tests for JSON output."""
+
+import json
+import sys
+
+import pytest
+
+from paracore import jsonio
+
+
+@pytest.mark.parametrize("have_orjson", [True, False])
+def test_write_json_matches_stdlib_output(monkeypatch, tmp_path, have_orjson):
+    """Saved JSON should be byte-identical with or without orjson for plain payloads."""
+    if not have_orjson:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    jsonio._encoder.cache_clear()
+    suggestions = {"time_min": 12, "mem_gb": 4, "_info": "Based on 3/5 successful pilot jobs — ok"}
+    path = tmp_path / "resources.json"
+
+    try:
+        jsonio.write_json(path, suggestions)
+    finally:
+        jsonio._encoder.cache_clear()
+
+    assert path.read_bytes() == json.dumps(suggestions, indent=2, ensure_ascii=False).encode()
+
+
+def test_encoder_is_resolved_once():
+    """The encoder should be picked on first use and reused afterwards."""
+    jsonio._encoder.cache_clear()
+    assert jsonio._encoder() is jsonio._encoder()
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from pathlib import Path
 from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
-from paracore.status import JobStatus, get_job_status
+from paracore.status import JobStatus, _infer_task, get_job_status, get_job_statuses
 
 
 class DummyJob:
@@ -128,3 +129,80 @@ def test_get_job_status_marks_running_when_logs_exist(monkeypatch: pytest.Monkey
     assert status.state == "RUNNING"
     assert status.stdout_path == tmp_paths["stdout"]
     assert status.stderr_path is None
+
+
+def test_get_job_statuses_refreshes_shared_watcher_once(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    """Several jobs sharing a watcher should trigger a single sacct update."""
+    watcher = Mock()
+    jobs = {}
+    for job_id, state in [("100_0", "COMPLETED"), ("100_1", "RUNNING"), ("200", "PENDING")]:
+        job = DummyJob(
+            job_id=job_id,
+            stdout=tmp_path / f"{job_id}.out",
+            stderr=tmp_path / f"{job_id}.err",
+            result_pickle=tmp_path / f"{job_id}.pkl",
+            state_value=state,
+            info={"State": state},
+        )
+        job.watcher = watcher
+        jobs[job_id] = job
+
+    monkeypatch.setattr("paracore.status._load_job", lambda job_id, log_dir: jobs[job_id])
+
+    statuses = get_job_statuses(list(jobs), log_dir=tmp_path)
+
+    watcher.update.assert_called_once()
+    assert {job_id: s.state for job_id, s in statuses.items()} == {
+        "100_0": "COMPLETED",
+        "100_1": "RUNNING",
+        "200": "PENDING",
+    }
+
+
+def test_get_job_statuses_lists_log_dir_instead_of_stat(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    """Batch status should find job artifacts from one directory listing."""
+    jobs = {}
+    for job_id in ("300_0", "300_1", "300_2"):
+        jobs[job_id] = DummyJob(
+            job_id=job_id,
+            stdout=tmp_path / f"{job_id}.out",
+            stderr=tmp_path / f"{job_id}.err",
+            result_pickle=tmp_path / f"{job_id}.pkl",
+        )
+    (tmp_path / "300_0.pkl").touch()
+    (tmp_path / "300_1.out").touch()
+
+    monkeypatch.setattr("paracore.status._load_job", lambda job_id, log_dir: jobs[job_id])
+
+    def no_stat(self):
+        raise AssertionError(f"unexpected stat of {self}")
+
+    monkeypatch.setattr(Path, "exists", no_stat)
+
+    statuses = get_job_statuses(list(jobs), log_dir=tmp_path)
+
+    assert statuses["300_0"].state == "COMPLETED"
+    assert statuses["300_1"].state == "RUNNING"
+    assert statuses["300_1"].stdout_path == tmp_path / "300_1.out"
+    assert statuses["300_2"].state == "UNKNOWN"
+    assert statuses["300_2"].stdout_path is None
+
+
+@pytest.mark.parametrize(
+    "job_id, expected",
+    [
+        ("12345_7", 7),
+        ("12345", None),
+        ("_7", None),
+        ("12345_", None),
+        ("1_2_3", None),
+        ("1_²", None),
+    ],
+)
+def test_infer_task(job_id, expected):
+    """Only ``jobid_task`` ids with a decimal task index should yield a task id."""
+    assert _infer_task(job_id) == expected
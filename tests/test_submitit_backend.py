@@ -1,56 +1,81 @@
 """Tests for Submitit backend."""
 
+import shlex
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 
-from paracore.config import Config
-from paracore.submitit_backend import SubmititBackend
+from paracore.submitit_backend import (
+    _ENV_SETUP_CHANGES,
+    SubmititBackend,
+    _direct_argv,
+    _make_timed,
+    _parse_maxrss_kb,
+    _run_command,
+)
+from paracore.types import BulkSubmitError, PilotMetrics, SubmitHandle
+
+RESOLVED_CONFIG = {
+    "cluster": "test",
+    "partition": "compute",
+    "time_min": 60,
+    "cpus_per_task": 4,
+    "mem_gb": 16,
+    "account": None,
+    "qos": None,
+    "max_array_parallelism": 100,
+    "extra": {},
+}
+
+
+class StubConfig:
+    """Minimal stand-in for Config that resolves to fixed settings."""
+
+    def resolve(self, cluster=None, **overrides):
+        return dict(RESOLVED_CONFIG)
+
+    def format_job_name(self, job_name, **context):
+        return "test-job"
 
 
 @pytest.fixture
 def mock_config():
-    """Create a mock config."""
-    config = Mock(spec=Config)
-    config.resolve.return_value = {
-        "cluster": "test",
-        "partition": "compute",
-        "time_min": 60,
-        "cpus_per_task": 4,
-        "mem_gb": 16,
-        "account": None,
-        "qos": None,
-        "max_array_parallelism": 100,
-        "extra": {},
-    }
-    config.format_job_name.return_value = "test-job"
-    return config
-
-
-@patch("paracore.submitit_backend.submitit.AutoExecutor")
-def test_submit_cmd(mock_executor_class, mock_config):
-    """Test submitting a single command."""
-    # Setup mock executor
-    mock_executor = Mock()
-    mock_executor_class.return_value = mock_executor
+    """Create a stub config."""
+    return StubConfig()
+
+
+@pytest.fixture
+def mock_executor(monkeypatch):
+    """Replace submitit.AutoExecutor with a mock class and return its executor."""
+    executor_class = Mock(return_value=Mock())
+    monkeypatch.setattr("paracore.submitit_backend.submitit.AutoExecutor", executor_class)
+    return executor_class.return_value
+
+
+@pytest.fixture
+def mock_run(monkeypatch):
+    """Replace subprocess.run with a mock."""
+    run = Mock()
+    monkeypatch.setattr("subprocess.run", run)
+    return run
 
+
+def test_submit_cmd(mock_executor, mock_config):
+    """Test submitting a single command."""
     mock_job = Mock()
     mock_job.job_id = "12345"
     mock_job.paths.stdout = "/logs/stdout"
     mock_job.paths.stderr = "/logs/stderr"
     mock_executor.submit.return_value = mock_job
 
-    # Setup mock subprocess
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value = Mock(returncode=0, stdout="output", stderr="")
-
-        # Submit command
-        backend = SubmititBackend(mock_config)
-        handle = backend.submit_cmd(
-            cmd="echo hello",
-            partition="compute",
-            time_min=30,
-        )
+    # Submit command
+    backend = SubmititBackend(mock_config)
+    handle = backend.submit_cmd(
+        cmd="echo hello",
+        partition="compute",
+        time_min=30,
+    )
 
     # Verify
     assert handle.job_id == "12345"
@@ -65,13 +90,8 @@ def test_submit_cmd(mock_executor_class, mock_config):
     assert params["time"] == 60  # from resolved config
 
 
-@patch("paracore.submitit_backend.submitit.AutoExecutor")
-def test_submit_cmd_array(mock_executor_class, mock_config):
+def test_submit_cmd_array(mock_executor, mock_config):
     """Test submitting an array of commands."""
-    # Setup mock executor
-    mock_executor = Mock()
-    mock_executor_class.return_value = mock_executor
-
     mock_jobs = []
     for i in range(3):
         job = Mock()
@@ -94,17 +114,129 @@ def test_submit_cmd_array(mock_executor_class, mock_config):
     assert handles[0].job_id == "12340"
     assert handles[1].array_index == 1
     assert handles[2].stdout_path == "/logs/stdout.2"
+    # Log paths are only formatted when read
+    assert vars(handles[2])["stderr_path"] is None
+    assert handles[2].stderr_path == "/logs/stderr.2"
+    assert SubmitHandle("1", "n", stdout_path="/given").stdout_path == "/given"
 
     # Check array parallelism
     params = mock_executor.update_parameters.call_args.kwargs
     assert params.get("array_parallelism") == 10
 
 
-@patch("paracore.submitit_backend.submitit.AutoExecutor")
-def test_submit_cmd_array_respects_max_parallelism(mock_executor_class, mock_config):
-    """Requesting array parallelism above configured max should fail."""
-    mock_executor_class.return_value = Mock()
+def test_submit_cmd_array_uses_single_array_submission(mock_executor, mock_config):
+    """All commands should go out in one array submission, never per-command submits."""
+    mock_executor.map_array.return_value = [Mock() for _ in range(40)]
+
+    backend = SubmititBackend(mock_config)
+    handles = backend.submit_cmd_array(cmds=[f"echo {i}" for i in range(40)])
+
+    assert len(handles) == 40
+    mock_executor.map_array.assert_called_once()
+    mock_executor.submit.assert_not_called()
+
+
+def test_submit_cmd_bulk_preserves_request_order(mock_config):
+    """Concurrent bulk submission should return handles in request order."""
+    backend = SubmititBackend(mock_config)
+
+    def fake_submit_cmd(cmd, **kwargs):
+        # Later requests finish first to exercise reordering
+        time.sleep(0.01 * (5 - int(cmd.split()[-1])))
+        return SubmitHandle(job_id=cmd.split()[-1], job_name=kwargs.get("job_name"))
+
+    with patch.object(backend, "submit_cmd", side_effect=fake_submit_cmd) as mock_submit:
+        handles = backend.submit_cmd_bulk(
+            [{"cmd": f"echo {i}", "job_name": "bulk"} for i in range(5)],
+            fanout=5,
+        )
+
+    assert [h.job_id for h in handles] == ["0", "1", "2", "3", "4"]
+    assert all(h.job_name == "bulk" for h in handles)
+    assert mock_submit.call_count == 5
+
+
+def test_submit_cmd_bulk_reports_failures_with_submitted_handles(mock_config):
+    """A failed request should not lose track of the jobs that were submitted."""
+    backend = SubmititBackend(mock_config)
+
+    def fake_submit_cmd(cmd, **kwargs):
+        if cmd == "echo 1":
+            raise RuntimeError("sbatch failed")
+        return SubmitHandle(job_id=cmd.split()[-1], job_name="bulk")
+
+    submit_patch = patch.object(backend, "submit_cmd", side_effect=fake_submit_cmd)
+    with submit_patch as mock_submit, pytest.raises(BulkSubmitError) as exc_info:
+        backend.submit_cmd_bulk([{"cmd": f"echo {i}"} for i in range(3)], fanout=3)
+
+    assert mock_submit.call_count == 3
+    assert [h and h.job_id for h in exc_info.value.handles] == ["0", None, "2"]
+    assert list(exc_info.value.errors) == [1]
+    assert isinstance(exc_info.value.__cause__, RuntimeError)
+
+
+def test_submit_cmd_bulk_spaces_submissions_by_max_rate(mock_config):
+    """A max_rate should space submission starts even with a wide fanout."""
+    backend = SubmititBackend(mock_config)
+    starts = []
+
+    def fake_submit_cmd(cmd, **kwargs):
+        starts.append(time.monotonic())
+        return SubmitHandle(job_id=cmd.split()[-1], job_name="bulk")
+
+    with patch.object(backend, "submit_cmd", side_effect=fake_submit_cmd):
+        backend.submit_cmd_bulk(
+            [{"cmd": f"echo {i}"} for i in range(4)],
+            fanout=4,
+            max_rate=50,
+        )
+
+    starts.sort()
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert all(gap >= 0.015 for gap in gaps)
+
+    with pytest.raises(ValueError, match="max_rate"):
+        backend.submit_cmd_bulk([{"cmd": "echo"}], max_rate=0)
+
+
+def test_submit_func_array_uses_single_array_submission(mock_executor, mock_config):
+    """Pilot function arrays should also go out as one array submission."""
+    mock_executor.map_array.return_value = [Mock() for _ in range(20)]
 
+    backend = SubmititBackend(mock_config)
+    handles = backend.submit_func_array(fn=abs, items=list(range(20)), collect_metrics=True)
+
+    assert [h.array_index for h in handles] == list(range(20))
+    mock_executor.map_array.assert_called_once()
+    assert mock_executor.map_array.call_args[0][1] == list(range(20))
+    mock_executor.submit.assert_not_called()
+
+
+def test_make_timed_wraps_result_in_pilot_metrics():
+    """Timed pilot functions should return their result alongside measurements."""
+    timed = _make_timed(lambda item: item * 2, measure_memory=True)
+    metrics = timed(21)
+
+    assert isinstance(metrics, PilotMetrics)
+    assert metrics.result == 42
+    assert metrics.duration_s >= 0
+    assert metrics.max_rss_mb is not None and metrics.max_rss_mb > 0
+
+    assert _make_timed(abs, measure_memory=False)(-3).max_rss_mb is None
+
+
+def test_submit_cmd_array_defaults_to_max_parallelism(mock_executor, mock_config):
+    """Arrays without an explicit array_parallelism run at the configured ceiling."""
+    mock_executor.map_array.return_value = []
+
+    SubmititBackend(mock_config).submit_cmd_array(cmds=["echo 1", "echo 2"])
+
+    params = mock_executor.update_parameters.call_args.kwargs
+    assert params["array_parallelism"] == 100
+
+
+def test_submit_cmd_array_respects_max_parallelism(mock_executor, mock_config):
+    """Requesting array parallelism above configured max should fail."""
     backend = SubmititBackend(mock_config)
 
     with pytest.raises(ValueError, match="array_parallelism exceeds configured max"):
@@ -157,45 +289,119 @@ def test_env_wrapper(mock_config):
         assert has_path is True
 
 
-@patch("subprocess.run")
+def test_env_wrapper_replace_drops_only_non_essential_vars(mock_config):
+    """Replace mode should keep essential and Slurm variables and overlay the user env."""
+    import os
+
+    backend = SubmititBackend(mock_config)
+    wrapped = backend._prepare_env_wrapper(
+        env={"PATH": "/opt/bin", "ONLY": "this"},
+        env_merge="replace",
+    )(lambda: dict(os.environ))
+
+    with patch.dict(
+        "os.environ",
+        {"PATH": "/usr/bin", "HOME": "/home/u", "SLURM_JOB_ID": "7", "OTHER": "stuff"},
+        clear=True,
+    ):
+        environ = wrapped()
+
+    assert environ == {"PATH": "/opt/bin", "HOME": "/home/u", "SLURM_JOB_ID": "7", "ONLY": "this"}
+
+
 def test_env_setup(mock_run, mock_config):
     """Test env_setup command execution."""
+    import os
+
     backend = SubmititBackend(mock_config)
+    _ENV_SETUP_CHANGES.clear()
 
-    # Success case
-    mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+    # Success case: the setup's resulting environment is dumped with env -0
+    mock_run.return_value = Mock(
+        returncode=0, stdout=b"PARACORE_TEST_ENV=prod\0SHLVL=2\0", stderr=b""
+    )
 
     wrapper = backend._prepare_env_wrapper(env_setup="source activate prod")
 
     def test_fn():
-        return "result"
+        return os.environ.get("PARACORE_TEST_ENV")
 
     wrapped = wrapper(test_fn)
-    result = wrapped()
-
-    assert result == "result"
-    mock_run.assert_called_once_with(
-        "source activate prod",
-        shell=True,
-        capture_output=True,
-        text=True,
-    )
+    with patch.dict("os.environ"):
+        assert wrapped() == "prod"
+        # A succeeded setup is not repeated within the same worker, but still applied
+        os.environ.pop("PARACORE_TEST_ENV")
+        assert wrapped() == "prod"
+        assert wrapped() == "prod"
+
+    mock_run.assert_called_once()
+    argv = mock_run.call_args.args[0]
+    assert os.path.basename(argv[0]) == "bash"
+    assert os.path.isabs(argv[0])
+    assert argv[1] == "-c"
+    assert "source activate prod" in argv[2]
+    assert argv[2].endswith("env -0")
+    assert mock_run.call_args.kwargs == {"capture_output": True, "close_fds": False}
+    assert {setup for setup, _ in _ENV_SETUP_CHANGES} == {"source activate prod"}
+    assert all(c == {"PARACORE_TEST_ENV": "prod"} for c in _ENV_SETUP_CHANGES.values())
+
+    # The same setup under a different env may compute different changes, so it reruns
+    other = backend._prepare_env_wrapper(
+        env_setup="source activate prod", env={"PARACORE_PROFILE": "other"}
+    )(test_fn)
+    with patch.dict("os.environ"):
+        other()
+        other()
+    assert mock_run.call_count == 2
 
     # Failure case
-    mock_run.return_value = Mock(returncode=1, stdout="", stderr="Setup failed")
+    _ENV_SETUP_CHANGES.clear()
+    mock_run.return_value = Mock(returncode=1, stdout=b"", stderr=b"Setup failed")
 
-    with pytest.raises(RuntimeError, match="env_setup failed"):
+    with pytest.raises(RuntimeError, match="env_setup failed: Setup failed"):
         wrapped()
+    assert not _ENV_SETUP_CHANGES
 
 
-@patch("paracore.submitit_backend.submitit.AutoExecutor")
-@patch("subprocess.run")
-def test_resource_measurement(mock_run, mock_executor_class, mock_config):
-    """Test resource measurement in pilot mode."""
-    # Setup mock executor
-    mock_executor = Mock()
-    mock_executor_class.return_value = mock_executor
+def test_env_setup_runs_in_sbatch_script_on_slurm(mock_run, mock_executor, mock_config):
+    """On Slurm, env_setup should go into the job script rather than each task."""
+    mock_executor.cluster = "slurm"
+    mock_executor.map_array.return_value = [Mock()]
+
+    backend = SubmititBackend(mock_config)
+    backend.submit_cmd_array(cmds=["python script.py"], env_setup="source activate prod")
+
+    setup = mock_executor.update_parameters.call_args_list[-1].kwargs["setup"]
+    assert setup[0] == "source activate prod"
+    assert mock_executor.map_array.call_args.args[0].args[1] is None
+
+    # In inherit mode the user env is exported ahead of the setup, which may read it
+    mock_executor.update_parameters.reset_mock()
+    backend.submit_cmd_array(
+        cmds=["python script.py"],
+        env_setup="source activate $PROFILE",
+        env={"PROFILE": "prod env"},
+    )
+    setup = mock_executor.update_parameters.call_args_list[-1].kwargs["setup"]
+    assert setup[:2] == ["export PROFILE='prod env'", "source activate $PROFILE"]
+    runner_fn = mock_executor.map_array.call_args.args[0]
+    assert runner_fn.args[1:3] == (None, None)
+
+    # Replace mode still applies the setup in the worker, after the replacement
+    mock_executor.update_parameters.reset_mock()
+    backend.submit_cmd_array(
+        cmds=["python script.py"],
+        env_setup="source activate prod",
+        env={"ONLY": "this"},
+        env_merge="replace",
+    )
+    assert all("setup" not in c.kwargs for c in mock_executor.update_parameters.call_args_list)
+    assert mock_executor.map_array.call_args.args[0].args[1] == "source activate prod"
+    mock_run.assert_not_called()
+
 
+def test_resource_measurement(mock_run, mock_executor, mock_config):
+    """Test resource measurement in pilot mode."""
     mock_job = Mock()
     mock_job.job_id = "99999"
     mock_job.paths.stdout = "/logs/stdout"
@@ -210,11 +416,13 @@ Command exited with non-zero status 0
     Maximum resident set size (kbytes): 2048000
     """
 
-    def run_side_effect(*args, **kwargs):
-        err_stream = kwargs.get("stderr")
-        if err_stream is not None:
-            err_stream.write(time_output)
-            err_stream.flush()
+    def run_side_effect(cmd, **kwargs):
+        # The command's stderr is left alone; /usr/bin/time writes its report to -o
+        assert "stderr" not in kwargs
+        argv = shlex.split(cmd)
+        report_path = argv[argv.index("-o") + 1]
+        with open(report_path, "w") as report:
+            report.write(time_output)
         return Mock(returncode=0)
 
     mock_run.side_effect = run_side_effect
@@ -230,21 +438,29 @@ Command exited with non-zero status 0
     # Get the submitted function and call it
     map_array_call = mock_executor.map_array.call_args
     runner_fn = map_array_call[0][0]
-    result = runner_fn(0)
+    result = runner_fn(map_array_call[0][1][0])
 
     # Verify metrics
-    assert "_paracore_metrics" in result
-    metrics = result["_paracore_metrics"]
-    assert pytest.approx(metrics["max_rss_mb"], rel=0.01) == 2000  # 2048000 KB / 1024
-    assert "duration_s" in metrics and metrics["duration_s"] >= 0
+    assert isinstance(result, PilotMetrics)
+    assert pytest.approx(result.max_rss_mb, rel=0.01) == 2000  # 2048000 KB / 1024
+    assert result.duration_s >= 0
 
 
-@patch("paracore.submitit_backend.submitit.AutoExecutor")
-@patch("subprocess.run")
-def test_resource_measurement_time_only(mock_run, mock_executor_class, mock_config):
+@pytest.mark.parametrize(
+    "report, expected",
+    [
+        (b"\tMaximum resident set size (kbytes): 2048000\n\tExit status: 0\n", 2048000),
+        (b"\tMaximum resident set size (kbytes): 512", 512),
+        (b"\tUser time (seconds): 0.01\n", None),
+    ],
+)
+def test_parse_maxrss_kb(report, expected):
+    """The peak RSS field should be read straight from the report bytes."""
+    assert _parse_maxrss_kb(report) == expected
+
+
+def test_resource_measurement_time_only(mock_run, mock_executor, mock_config):
     """Collect metrics without measuring memory."""
-    mock_executor = Mock()
-    mock_executor_class.return_value = mock_executor
 
     mock_job = Mock()
     mock_job.job_id = "22222"
@@ -256,15 +472,46 @@ def test_resource_measurement_time_only(mock_run, mock_executor_class, mock_conf
 
     backend = SubmititBackend(mock_config)
     backend.submit_cmd_array(
-        cmds=["python script.py"],
+        cmds=["python script.py > out.txt"],
         collect_metrics=True,
         measure_memory=False,
     )
 
     map_array_call = mock_executor.map_array.call_args
     runner_fn = map_array_call[0][0]
-    result = runner_fn(0)
-
-    metrics = result["_paracore_metrics"]
-    assert "duration_s" in metrics
-    assert "max_rss_mb" not in metrics
+    result = runner_fn(map_array_call[0][1][0])
+
+    assert isinstance(result, PilotMetrics)
+    assert result.duration_s >= 0
+    assert result.max_rss_mb is None
+    assert mock_run.call_args.kwargs["close_fds"] is False
+
+
+@pytest.mark.parametrize(
+    "cmd, argv",
+    [
+        ("python script.py --n 3", ["python", "script.py", "--n", "3"]),
+        ("python script.py > out.txt", None),
+        ("echo $HOME", None),
+        ("grep 'a b' file", None),
+        ("cd /tmp", None),
+        ("FOO=1 env", None),
+    ],
+)
+def test_direct_argv_only_accepts_plain_words(cmd, argv):
+    """Commands go around the shell only when it would not interpret anything."""
+    assert _direct_argv(cmd) == argv
+
+
+def test_run_command_spawns_plain_commands_directly(mock_run):
+    """Plain commands are spawned without /bin/sh and report their exit codes."""
+    assert _run_command("true") is None
+    mock_run.assert_not_called()
+
+    with pytest.raises(RuntimeError, match="exit code 1"):
+        _run_command("false")
+
+    # A program that is not on PATH falls back to the shell, which reports it
+    mock_run.return_value = Mock(returncode=0)
+    _run_command("paracore-no-such-program --flag")
+    assert mock_run.call_args.args[0] == "paracore-no-such-program --flag"